@@ -22,20 +22,22 @@ Requirements:
 """
 
 import os
+import re
 import sys
-import shutil
-import subprocess
+import time
 import tkinter as tk
-from tkinter import messagebox
 import logging
-from datetime import datetime, timedelta
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 import socket
 import struct
 import fcntl
 
 # Import sensor modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from sensors.bme690 import BME690Sensor
+from sensors.bme690 import get_sensor
 from sensors.speaker import get_speaker
 
 logging.basicConfig(
@@ -46,24 +48,358 @@ logger = logging.getLogger('rpi_gui')
 
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 RF_SCRIPT_PATH = os.path.join(BASE_DIR, 'rf', 'setup_pi.sh')
+TPMS_GUI_PATH = os.path.join(BASE_DIR, 'rf', 'tpms_monitor_gui.py')
+VENV_PYTHON = os.path.join(BASE_DIR, '.venv', 'bin', 'python')
+
+# Checked once at startup; run_rf_script() only re-checks while it is missing
+_TPMS_GUI_OK = os.path.isfile(TPMS_GUI_PATH)
+if not _TPMS_GUI_OK:
+    logger.warning(f"TPMS monitor not found: {TPMS_GUI_PATH}")
+
+# UNIFORM touch buttons - all same size (per-button colours are added at creation)
+BUTTON_STYLE = {
+    'font': ('Arial', 16, 'bold'),
+    'width': 16,
+    'height': 2,
+    'relief': 'raised',
+    'bd': 4,
+    'fg': 'white'
+}
+
+
+def _find_executable(names):
+    """Return the absolute path of the first of `names` found on PATH, or None.
+
+    A plain stat()/access() walk over PATH - no `which` child process.
+    """
+    path_dirs = os.environ.get('PATH', os.defpath).split(os.pathsep)
+    for name in names:
+        for d in path_dirs:
+            candidate = os.path.join(d, name)
+            if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+                return candidate
+    return None
+
+
+# Absolute paths for launched commands, resolved once so spawns skip the PATH search
+SUDO = _find_executable(('sudo',)) or '/usr/bin/sudo'
+REBOOT = _find_executable(('reboot',)) or '/sbin/reboot'
+PYTHON3 = _find_executable(('python3',)) or '/usr/bin/python3'
+
+# Interpreter for the TPMS monitor: the project venv if present, else system python3
+TPMS_PYTHON = VENV_PYTHON if os.path.exists(VENV_PYTHON) else PYTHON3
+
+# Terminal emulator for "Open Terminal", resolved once at startup
+_TERMINALS = ('x-terminal-emulator', 'xterm', 'lxterminal', 'gnome-terminal')
+_TERMINAL = _find_executable(_TERMINALS)
+
+# Fixed (title, message) pairs for dialogs
+_MSGS = {
+    'no_term': ("No Terminal", "No terminal emulator found.\nInstall xterm: sudo apt install xterm"),
+    'no_speaker': ("Speaker Not Available",
+                   "Speaker hardware not initialized.\n"
+                   "Ensure GPIO pin 12 is properly wired."),
+    'confirm_reboot': ("Confirm Reboot", "Reboot Raspberry Pi now?"),
+    'confirm_exit': ("Confirm Exit", "Exit RPI Lab GUI?"),
+}
+
+
+# CPUs the process may use, captured before main() pins the Tk thread
+_ALL_CPUS = os.sched_getaffinity(0) if hasattr(os, 'sched_getaffinity') else None
+
+
+def _pin_tk_thread():
+    """Pin the calling (Tk) thread to one CPU so redraws keep a warm cache."""
+    if not _ALL_CPUS or len(_ALL_CPUS) < 2:
+        return
+    cpu = max(_ALL_CPUS)
+    try:
+        os.sched_setaffinity(0, {cpu})  # 0 = calling thread on Linux
+        logger.info(f"Tk thread pinned to CPU {cpu}")
+    except OSError as e:
+        logger.info(f"Could not pin Tk thread: {e}")
+
+
+def _unpin_thread():
+    """I/O pool initializer: let workers use every CPU, not the Tk thread's."""
+    if _ALL_CPUS:
+        try:
+            os.sched_setaffinity(0, _ALL_CPUS)
+        except OSError:
+            pass
+
+
+def _spawn(cmd):
+    """Launch a helper process without waiting for it.
+
+    close_fds=False skips closing every inherited descriptor before exec
+    (the GUI holds none worth hiding). Together with an absolute executable
+    path this lets CPython use posix_spawn() instead of fork()+exec(), so
+    launch cost does not grow with the GUI's memory footprint. stdout/stderr
+    stay inherited so child output still reaches the journal.
+    """
+    import subprocess  # deferred: only needed once a button launches something
+
+    exe = cmd[0] if os.path.isabs(cmd[0]) else _find_executable((cmd[0],))
+    if exe is None:
+        raise FileNotFoundError(f"{cmd[0]} not found in PATH")
+    return subprocess.Popen([exe, *cmd[1:]], close_fds=False, stdin=subprocess.DEVNULL)
+
+
+def _logind_reboot():
+    """Ask systemd-logind to reboot with a single D-Bus call (no fork/exec).
+
+    Requires the optional jeepney package and polkit permission for the
+    calling user; raises on any failure so the caller can fall back.
+    """
+    from jeepney import DBusAddress, new_method_call
+    from jeepney.io.blocking import open_dbus_connection
+    from jeepney.wrappers import unwrap_msg
+
+    login1 = DBusAddress(
+        '/org/freedesktop/login1',
+        bus_name='org.freedesktop.login1',
+        interface='org.freedesktop.login1.Manager'
+    )
+    with open_dbus_connection(bus='SYSTEM') as conn:
+        unwrap_msg(conn.send_and_get_reply(new_method_call(login1, 'Reboot', 'b', (True,))))
+
+
+def _reboot():
+    """Reboot via logind, falling back to `sudo reboot` if D-Bus is unavailable."""
+    try:
+        _logind_reboot()
+    except Exception as e:
+        logger.info(f"logind reboot unavailable ({e}), falling back to sudo reboot")
+        _spawn([SUDO, REBOOT])
+
+
+class _LazySensor:
+    """Handle for the shared BME690 sensor that defers get_sensor() to first use.
+
+    The read methods resolve the sensor inside the call, so when they are
+    submitted to the I/O pool the I2C probe and chip setup run there rather
+    than on the Tk thread before the first paint. Reads go straight to the
+    sensor, whose own READ_CACHE_TTL cache lets concurrent callers share one
+    I2C transaction.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._sensor = None
+        self._lock = threading.Lock()
+
+    def _ensure_sensor(self):
+        """Return the shared sensor, constructing it on the first call."""
+        sensor = self._sensor
+        if sensor is None:
+            with self._lock:
+                if self._sensor is None:
+                    self._sensor = self._factory()
+                sensor = self._sensor
+        return sensor
+
+    def __getattr__(self, name):
+        # Everything except the read methods (available, heat_stable, ...) passes through
+        return getattr(self._ensure_sensor(), name)
+
+    def read_all(self):
+        """Return (h, t, p, g, formatted) from the shared sensor."""
+        return self._ensure_sensor().read_all()
+
+    def read(self):
+        """Return (h, t, p, g) from the shared sensor."""
+        return self._ensure_sensor().read()
+
+    def read_formatted(self):
+        """Return the formatted dict from the shared sensor."""
+        return self._ensure_sensor().read_formatted()
+
 
 # Initialize BME690 sensor (I2C 0x76 by default)
-BME_SENSOR = BME690Sensor()
+BME_SENSOR = _LazySensor(get_sensor)
 
 # Initialize speaker
 SPEAKER = get_speaker()
 
 
+# "nameserver <addr>" lines in resolv.conf
+_NAMESERVER_RE = re.compile(rb'(?m)^nameserver[ \t]+(\S+)')
+
+# Default-route rows in /proc/net/route: destination 00000000, capturing
+# the gateway and flags columns
+_DEFAULT_ROUTE_RE = re.compile(rb'(?m)^[^\t]+\t00000000\t([0-9A-Fa-f]{8})\t([0-9A-Fa-f]{4})')
+
+# rtnetlink constants (linux/netlink.h, linux/rtnetlink.h, linux/if_addr.h)
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+NLM_F_REQUEST = 0x1
+NLM_F_DUMP = 0x300
+RTM_NEWADDR = 20
+RTM_GETADDR = 22
+RTM_NEWROUTE = 24
+RTM_GETROUTE = 26
+IFA_ADDRESS = 1
+IFA_LOCAL = 2
+RTA_OIF = 4
+RTA_GATEWAY = 5
+RTA_TABLE = 15
+RT_TABLE_MAIN = 254
+# Multicast groups whose messages invalidate the cached snapshot
+RTMGRP_LINK = 0x1
+RTMGRP_IPV4_IFADDR = 0x10
+RTMGRP_IPV4_ROUTE = 0x40
+
+
+@dataclass(slots=True)
+class NetSnapshot:
+    """Addressing for the primary interface, as shown in the GUI header."""
+    ip: str = 'N/A'
+    cidr: str = '/N/A'
+    gateway: str = 'N/A'
+    dns: list = field(default_factory=lambda: ['N/A'])
+
+
+def _rtattrs(buf, offset, end):
+    """Yield (type, payload) for each rtattr in buf[offset:end]."""
+    while offset + 4 <= end:
+        rta_len, rta_type = struct.unpack_from('=HH', buf, offset)
+        if rta_len < 4:
+            break
+        yield rta_type, buf[offset + 4:offset + rta_len]
+        offset += (rta_len + 3) & ~3
+
+
+def _netlink_dump(sock, msg_type, body, seq):
+    """Send one rtnetlink dump request and yield (type, payload) per reply message."""
+    sock.send(struct.pack('=LHHLL', 16 + len(body), msg_type,
+                          NLM_F_REQUEST | NLM_F_DUMP, seq, 0) + body)
+    while True:
+        data = sock.recv(65536)
+        offset = 0
+        while offset + 16 <= len(data):
+            msg_len, mtype, _flags, mseq, _pid = struct.unpack_from('=LHHLL', data, offset)
+            if msg_len < 16:
+                return
+            if mseq == seq:
+                if mtype == NLMSG_DONE:
+                    return
+                if mtype == NLMSG_ERROR:
+                    raise OSError(-struct.unpack_from('=i', data, offset + 16)[0], "netlink dump failed")
+                yield mtype, data[offset + 16:offset + msg_len]
+            offset += (msg_len + 3) & ~3
+
+
+# Shared fd for the SIOCGIF* ioctl fallbacks; never sent on. If it has been
+# closed, fileno() is -1 and the ioctl fails into the usual 'N/A' path.
+_IOCTL_SOCK = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+
 class NetworkInfo:
     """Network information retrieval."""
 
+    # Cached netlink snapshot, dropped whenever the kernel announces a link,
+    # IPv4 address or IPv4 route change on the subscription socket
+    _cached = None
+    _events = None
+
+    @classmethod
+    def snapshot(cls, ifnames=('eth0', 'wlan0')):
+        """Return IP, CIDR, gateway and DNS for the first configured interface.
+
+        Addresses and the default route come from one rtnetlink dump each and
+        are reused until a change notification arrives. DNS servers are read
+        from resolv.conf on every call since netlink does not cover them.
+        Falls back to the ioctl/procfs helpers if netlink is unavailable.
+        """
+        try:
+            if cls._events is None:
+                cls._events = cls._subscribe()
+            # Drain pending notifications; any at all means the cache is stale
+            try:
+                while cls._events.recv(65536):
+                    cls._cached = None
+            except BlockingIOError:
+                pass
+            except OSError as e:
+                # Typically ENOBUFS after a burst: the kernel dropped
+                # notifications, so resubscribe and re-query from scratch
+                logger.debug(f"Netlink event socket error, resubscribing: {e}")
+                cls._cached = None
+                cls._events.close()
+                cls._events = None
+                cls._events = cls._subscribe()
+            if cls._cached is None:
+                cls._cached = cls._netlink_query(ifnames)
+            ip, cidr, gateway = cls._cached
+        except Exception as e:
+            logger.debug(f"Netlink query failed, using ioctl fallback: {e}")
+            ip = cls.get_ip_address()
+            cidr = cls.get_netmask()
+            gateway = cls.get_gateway()
+        return NetSnapshot(ip, cidr, gateway, cls.get_dns_servers())
+
+    @staticmethod
+    def _subscribe():
+        """Open a non-blocking rtnetlink socket joined to the link/address/route groups."""
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+        try:
+            sock.bind((0, RTMGRP_LINK | RTMGRP_IPV4_IFADDR | RTMGRP_IPV4_ROUTE))
+            sock.setblocking(False)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    @staticmethod
+    def _netlink_query(ifnames):
+        """Dump IPv4 addresses and routes; return (ip, cidr, gateway) strings."""
+        indexes = {}
+        for name in ifnames:
+            try:
+                indexes[socket.if_nametoindex(name)] = name
+            except OSError:
+                pass
+
+        addrs = {}  # ifindex -> (ip, prefixlen)
+        gateway = 'N/A'
+        with socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE) as nl:
+            ifaddrmsg = struct.pack('=BBBBL', socket.AF_INET, 0, 0, 0, 0)
+            for mtype, msg in _netlink_dump(nl, RTM_GETADDR, ifaddrmsg, 1):
+                if mtype != RTM_NEWADDR:
+                    continue
+                _family, prefixlen, _flags, _scope, index = struct.unpack_from('=BBBBL', msg)
+                if index not in indexes or index in addrs:
+                    continue
+                attrs = dict(_rtattrs(msg, 8, len(msg)))
+                raw = attrs.get(IFA_LOCAL) or attrs.get(IFA_ADDRESS)
+                if raw:
+                    addrs[index] = (socket.inet_ntoa(raw), prefixlen)
+
+            rtmsg = struct.pack('=BBBBBBBBL', socket.AF_INET, 0, 0, 0, 0, 0, 0, 0, 0)
+            for mtype, msg in _netlink_dump(nl, RTM_GETROUTE, rtmsg, 2):
+                if mtype != RTM_NEWROUTE or gateway != 'N/A':
+                    continue
+                dst_len, table = msg[1], msg[4]
+                attrs = dict(_rtattrs(msg, 12, len(msg)))
+                if RTA_TABLE in attrs:
+                    table = struct.unpack('=L', attrs[RTA_TABLE])[0]
+                if dst_len == 0 and table == RT_TABLE_MAIN and RTA_GATEWAY in attrs:
+                    gateway = socket.inet_ntoa(attrs[RTA_GATEWAY])
+
+        # Preserve the eth0-then-wlan0 preference of the ioctl helpers
+        for index, name in indexes.items():
+            if index in addrs:
+                ip, prefixlen = addrs[index]
+                return ip, f"/{prefixlen}", gateway
+        return 'N/A', '/N/A', gateway
+
     @staticmethod
     def get_ip_address(ifname='eth0'):
         """Get IP address for network interface."""
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             ip = socket.inet_ntoa(fcntl.ioctl(
-                s.fileno(),
+                _IOCTL_SOCK.fileno(),
                 0x8915,  # SIOCGIFADDR
                 struct.pack('256s', ifname[:15].encode('utf-8'))
             )[20:24])
@@ -78,14 +414,13 @@ class NetworkInfo:
     def get_netmask(ifname='eth0'):
         """Get netmask for network interface and return in CIDR notation."""
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            netmask = socket.inet_ntoa(fcntl.ioctl(
-                s.fileno(),
+            raw = fcntl.ioctl(
+                _IOCTL_SOCK.fileno(),
                 0x891b,  # SIOCGIFNETMASK
                 struct.pack('256s', ifname[:15].encode('utf-8'))
-            )[20:24])
-            # Convert netmask to CIDR notation
-            cidr = sum([bin(int(x)).count('1') for x in netmask.split('.')])
+            )[20:24]
+            # Prefix length is the number of set bits in the mask
+            cidr = int.from_bytes(raw, 'big').bit_count()
             return f"/{cidr}"
         except Exception:
             if ifname == 'eth0':
@@ -96,29 +431,25 @@ class NetworkInfo:
     def get_gateway():
         """Get default gateway."""
         try:
-            with open("/proc/net/route") as fh:
-                for line in fh:
-                    fields = line.strip().split()
-                    if fields[1] != '00000000' or not int(fields[3], 16) & 2:
-                        continue
-                    return socket.inet_ntoa(struct.pack("<L", int(fields[2], 16)))
+            with open("/proc/net/route", "rb") as fh:
+                data = fh.read()
         except Exception:
-            pass
+            return 'N/A'
+        for m in _DEFAULT_ROUTE_RE.finditer(data):
+            if int(m.group(2), 16) & 2:  # RTF_GATEWAY
+                # Gateway column is the address in host (little-endian) byte order
+                return socket.inet_ntoa(bytes.fromhex(m.group(1).decode())[::-1])
         return 'N/A'
 
     @staticmethod
     def get_dns_servers():
         """Get DNS servers from resolv.conf."""
-        dns_servers = []
         try:
-            with open('/etc/resolv.conf', 'r') as f:
-                for line in f:
-                    if line.startswith('nameserver'):
-                        dns = line.split()[1]
-                        dns_servers.append(dns)
+            with open('/etc/resolv.conf', 'rb') as f:
+                data = f.read()
         except Exception:
-            pass
-        return dns_servers if dns_servers else ['N/A']
+            return ['N/A']
+        return [m.group(1).decode() for m in _NAMESERVER_RE.finditer(data)] or ['N/A']
 
 
 class RPILauncherGUI:
@@ -129,6 +460,28 @@ class RPILauncherGUI:
         # Error tracking for sensor updates with exponential backoff
         self.sensor_error_count = 0
         self.update_interval = 5000  # Initial update interval in milliseconds
+        # Reads are scheduled against a monotonic deadline so slow reads
+        # don't stretch the polling cadence
+        self._next_sensor_deadline = time.monotonic()
+        
+        # Network refresh backs off while the snapshot stays the same
+        self.net_interval = 30000  # milliseconds; doubles up to 5 minutes
+        self._last_net = None
+        
+        # All blocking work (sensor reads, network queries, process launches,
+        # reboot) runs on one shared I/O pool so the Tk event loop never waits
+        # on I2C, netlink or fork/exec.
+        # Workers never touch widgets: finished futures are queued and drained
+        # on the Tk thread by _pump_queue().
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='rpi-io',
+                                           initializer=_unpin_thread)
+        self._result_q = queue.Queue()
+        self._pending = 0  # submitted jobs not yet delivered (Tk thread only)
+        
+        # Last options applied to each sensor/network label (and last value of
+        # each readout variable), so unchanged values skip the Tcl round-trip
+        # and redraw
+        self._shown = {}
         
         # Alert tracking
         self.last_gas_alert = None
@@ -178,7 +531,7 @@ class RPILauncherGUI:
         # Real-time clock (right-aligned in the header)
         self.clock_label = tk.Label(
             header_frame,
-            text=datetime.now().strftime("%H:%M:%S  %d %b %Y"),
+            text=time.strftime("%H:%M:%S  %d %b %Y"),
             font=('Arial', 18, 'bold'),
             fg='#aaaaaa',
             bg='#1e1e1e',
@@ -260,89 +613,40 @@ class RPILauncherGUI:
         sensor_data_frame = tk.Frame(self.sensor_frame, bg='#2d2d2d')
         sensor_data_frame.pack(pady=5)
         
-        # Temperature display
-        temp_container = tk.Frame(sensor_data_frame, bg='#2d2d2d')
-        temp_container.grid(row=0, column=0, padx=10, pady=2)
-        
-        tk.Label(
-            temp_container,
-            text="Temp:",
-            font=('Arial', 12, 'bold'),
-            fg='#ffffff',
-            bg='#2d2d2d'
-        ).pack(side='left')
-        
-        self.temp_label = tk.Label(
-            temp_container,
-            text="--°C",
-            font=('Arial', 18, 'bold'),
-            fg='#ff6b6b',
-            bg='#2d2d2d'
-        )
-        self.temp_label.pack(side='left', padx=5)
-        
-        # Humidity display
-        humid_container = tk.Frame(sensor_data_frame, bg='#2d2d2d')
-        humid_container.grid(row=0, column=1, padx=10, pady=2)
-        
-        tk.Label(
-            humid_container,
-            text="Humid:",
-            font=('Arial', 12, 'bold'),
-            fg='#ffffff',
-            bg='#2d2d2d'
-        ).pack(side='left')
+        # Readout specs: (caption, label attribute, text variable attribute,
+        # placeholder, value font size, value colour, grid row, grid column,
+        # extra grid options)
+        readouts = [
+            ("Temp:", 'temp_label', 'temp_var', "--°C", 18, '#ff6b6b', 0, 0, {}),
+            ("Humid:", 'humid_label', 'humid_var', "--%", 18, '#4ecdc4', 0, 1, {}),
+            ("Press:", 'press_label', 'press_var', "-- hPa", 18, '#9aa0ff', 1, 0, {}),
+            ("Gas:", 'gas_label', 'gas_var', "-- Ω", 16, '#ffae00', 1, 1, {'sticky': 'w'}),
+        ]
         
-        self.humid_label = tk.Label(
-            humid_container,
-            text="--%",
-            font=('Arial', 18, 'bold'),
-            fg='#4ecdc4',
-            bg='#2d2d2d'
-        )
-        self.humid_label.pack(side='left', padx=5)
-
-        # Pressure display
-        press_container = tk.Frame(sensor_data_frame, bg='#2d2d2d')
-        press_container.grid(row=1, column=0, padx=10, pady=2)
-
-        tk.Label(
-            press_container,
-            text="Press:",
-            font=('Arial', 12, 'bold'),
-            fg='#ffffff',
-            bg='#2d2d2d'
-        ).pack(side='left')
-
-        self.press_label = tk.Label(
-            press_container,
-            text="-- hPa",
-            font=('Arial', 18, 'bold'),
-            fg='#9aa0ff',
-            bg='#2d2d2d'
-        )
-        self.press_label.pack(side='left', padx=5)
-
-        # Gas resistance display
-        gas_container = tk.Frame(sensor_data_frame, bg='#2d2d2d')
-        gas_container.grid(row=1, column=1, padx=10, pady=2, sticky='w')
-
-        tk.Label(
-            gas_container,
-            text="Gas:",
-            font=('Arial', 12, 'bold'),
-            fg='#ffffff',
-            bg='#2d2d2d'
-        ).pack(side='left')
-
-        self.gas_label = tk.Label(
-            gas_container,
-            text="-- Ω",
-            font=('Arial', 16, 'bold'),
-            fg='#ffae00',
-            bg='#2d2d2d'
-        )
-        self.gas_label.pack(side='left', padx=5)
+        for caption, attr, var_attr, placeholder, size, fg, row, col, grid_opts in readouts:
+            container = tk.Frame(sensor_data_frame, bg='#2d2d2d')
+            container.grid(row=row, column=col, padx=10, pady=2, **grid_opts)
+            
+            tk.Label(
+                container,
+                text=caption,
+                font=('Arial', 12, 'bold'),
+                fg='#ffffff',
+                bg='#2d2d2d'
+            ).pack(side='left')
+            
+            # Values are pushed through a StringVar, one Tcl setvar per change
+            value_var = tk.StringVar(self.root, value=placeholder)
+            value_label = tk.Label(
+                container,
+                textvariable=value_var,
+                font=('Arial', size, 'bold'),
+                fg=fg,
+                bg='#2d2d2d'
+            )
+            value_label.pack(side='left', padx=5)
+            setattr(self, attr, value_label)
+            setattr(self, var_attr, value_var)
         
         # Status label (last update)
         self.sensor_status = tk.Label(
@@ -392,16 +696,6 @@ class RPILauncherGUI:
         button_frame.pack(fill='x', expand=False, padx=10, pady=5)
         button_frame.grid_columnconfigure((0, 1), weight=1, uniform='btns')
         
-        # UNIFORM touch buttons - all same size
-        button_config = {
-            'font': ('Arial', 16, 'bold'),
-            'width': 16,
-            'height': 2,
-            'relief': 'raised',
-            'bd': 4,
-            'fg': 'white'
-        }
-
         buttons = [
             ("📡 TPMS Monitor", self.run_rf_script, '#2d89ef', '#1e5fa8'),
             ("🔊 Test Speaker", self.test_beep, '#f7630c', '#c4500a'),
@@ -418,7 +712,7 @@ class RPILauncherGUI:
                 command=cmd,
                 bg=bg,
                 activebackground=active_bg,
-                **button_config
+                **BUTTON_STYLE
             )
             btn.grid(row=row, column=col, padx=6, pady=6, sticky='nsew')
 
@@ -444,7 +738,7 @@ class RPILauncherGUI:
         
         # Start update loops
         self.update_network_info()
-        self.update_sensor_readings()
+        self._kick_sensor_read()
         self.update_clock()
         
         # Play startup beep
@@ -455,26 +749,36 @@ class RPILauncherGUI:
     
     def update_clock(self):
         """Update the real-time clock label every second."""
-        self.clock_label.config(text=datetime.now().strftime("%H:%M:%S  %d %b %Y"))
+        self.clock_label.config(text=time.strftime("%H:%M:%S  %d %b %Y"))
         self.root.after(1000, self.update_clock)
 
     def update_network_info(self):
-        """Update network information display."""
+        """Refresh network information on the I/O pool."""
+        self._submit(NetworkInfo.snapshot, self._apply_net_update)
+
+    def _apply_net_update(self, fut):
+        """Update network information display from a completed snapshot."""
         try:
-            ip = NetworkInfo.get_ip_address()
-            mask = NetworkInfo.get_netmask()
-            gateway = NetworkInfo.get_gateway()
-            dns_servers = NetworkInfo.get_dns_servers()
+            net = fut.result()
+            
+            # Addressing rarely changes, so these are usually no-ops
+            self._show(self.net_ip_label, text=f"IP: {net.ip}{net.cidr}")
+            self._show(self.net_gateway_label, text=f"GW: {net.gateway}")
+            dns_text = "DNS: " + ", ".join(net.dns[:2])  # Show first 2 DNS servers
+            self._show(self.net_dns_label, text=dns_text)
             
-            self.net_ip_label.config(text=f"IP: {ip}{mask}")
-            self.net_gateway_label.config(text=f"GW: {gateway}")
-            dns_text = "DNS: " + ", ".join(dns_servers[:2])  # Show first 2 DNS servers
-            self.net_dns_label.config(text=dns_text)
+            # Stable network - poll less often; any change resets to 30 sec
+            if net == self._last_net:
+                self.net_interval = min(self.net_interval * 2, 300000)
+            else:
+                self.net_interval = 30000
+            self._last_net = net
         except Exception as e:
             logger.error(f"Network info update error: {e}")
+            self.net_interval = 30000
         
-        # Update network info every 30 seconds
-        self.root.after(30000, self.update_network_info)
+        # Schedule next refresh once pending input is handled
+        self.root.after(self.net_interval, self.root.after_idle, self.update_network_info)
     
     def get_gas_heater_status(self, gas_resistance):
         """Determine gas heater status based on resistance value.
@@ -537,12 +841,14 @@ class RPILauncherGUI:
     
     def check_sensor_alerts(self, h, t, p, g):
         """Check sensor values and trigger alerts if thresholds exceeded."""
-        current_time = datetime.now()
+        # Monotonic seconds: immune to NTP steps; None means never alerted
+        # (not 0.0, since the clock starts near zero at boot)
+        current_time = time.monotonic()
         
         # Gas alert - beep every 15 seconds if volatile gases detected
         if g is not None and g < self.gas_threshold:
             if self.last_gas_alert is None or \
-               (current_time - self.last_gas_alert).total_seconds() >= self.gas_alert_interval:
+               current_time - self.last_gas_alert >= self.gas_alert_interval:
                 logger.warning(f"Gas alert! Resistance: {g:.0f} Ω (threshold: {self.gas_threshold} Ω)")
                 if SPEAKER.available:
                     SPEAKER.beep_gas_alert()
@@ -551,7 +857,7 @@ class RPILauncherGUI:
         # Temperature alert - beep hourly if out of range
         if t is not None and (t < self.temp_min or t > self.temp_max):
             if self.last_temp_alert is None or \
-               (current_time - self.last_temp_alert).total_seconds() >= self.hourly_alert_interval:
+               current_time - self.last_temp_alert >= self.hourly_alert_interval:
                 logger.warning(f"Temperature alert! {t:.1f}°C (range: {self.temp_min}-{self.temp_max}°C)")
                 if SPEAKER.available:
                     SPEAKER.beep_temp_alert()
@@ -560,30 +866,114 @@ class RPILauncherGUI:
         # Humidity alert - beep hourly if out of range
         if h is not None and (h < self.humidity_min or h > self.humidity_max):
             if self.last_humidity_alert is None or \
-               (current_time - self.last_humidity_alert).total_seconds() >= self.hourly_alert_interval:
+               current_time - self.last_humidity_alert >= self.hourly_alert_interval:
                 logger.warning(f"Humidity alert! {h:.1f}% (range: {self.humidity_min}-{self.humidity_max}%)")
                 if SPEAKER.available:
                     SPEAKER.beep_humidity_alert()
                 self.last_humidity_alert = current_time
     
-    def update_sensor_readings(self):
-        """Update sensor readings on main screen with error recovery and alert monitoring."""
-        try:
-            # Single hardware read — read_formatted() also calls read() internally, so
-            # calling both was wasteful. Read once and format inline.
-            h, t, p, g = BME_SENSOR.read()
+    def _submit(self, fn, callback, *args):
+        """Run fn(*args) on the I/O pool; callback(future) later runs on the Tk thread."""
+        fut = self._io_pool.submit(fn, *args)
+        fut.add_done_callback(lambda f: self._result_q.put((callback, f)))
+        self._pending += 1
+        if self._pending == 1:
+            self.root.after(20, self._pump_queue)
+
+    def _pump_queue(self):
+        """Deliver finished background jobs to their callbacks on the Tk thread.
+
+        Only runs while jobs are outstanding, so an idle GUI doesn't wake up.
+        """
+        while True:
+            try:
+                callback, fut = self._result_q.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            try:
+                callback(fut)
+            except Exception as e:
+                logger.error(f"Background job callback failed: {e}", exc_info=True)
+        if self._pending > 0:
+            self.root.after(20, self._pump_queue)
+
+    def _launch(self, cmd, action):
+        """Spawn cmd on the I/O pool and report failures on the Tk thread."""
+        self._submit(_spawn, lambda fut: self._report_launch(fut, action), cmd)
+
+    def _report_launch(self, fut, action):
+        """Show an error dialog if a background launch failed."""
+        e = fut.exception()
+        if e is not None:
+            from tkinter import messagebox
+            logger.error(f"Failed to {action}: {e}")
+            messagebox.showerror("Error", f"Failed to {action}:\n{e}")
+
+    def _kick_sensor_read(self):
+        """Submit a sensor read to the I/O pool."""
+        # BME_SENSOR.read_all must stay a real method of _LazySensor: a
+        # __getattr__-forwarded lookup here would build the sensor (I2C
+        # probe) on the Tk thread instead of on the pool
+        self._submit(BME_SENSOR.read_all, self._on_sensor_read)
+
+    def _on_sensor_read(self, fut):
+        """Apply a completed sensor read and schedule the next one."""
+        self.update_sensor_readings(fut)
+        # Schedule next read with current interval (may have changed due to errors),
+        # measured from when this read was due rather than when it finished
+        self._next_sensor_deadline += self.update_interval / 1000
+        now = time.monotonic()
+        if self._next_sensor_deadline < now:
+            # Fell behind (very slow read or system suspend) - don't burst to catch up
+            self._next_sensor_deadline = now
+        delay_ms = int((self._next_sensor_deadline - now) * 1000)
+        # Dispatch from the idle queue so pending input is handled first
+        self.root.after(delay_ms, self.root.after_idle, self._kick_sensor_read)
 
-            temp_str  = f"{t:.2f}°C"    if t is not None else "N/A"
-            humid_str = f"{h:.2f}%"     if h is not None else "N/A"
-            press_str = f"{p:.2f} hPa"  if p is not None else "N/A"
+    def _show(self, label, **options):
+        """Configure label only if options differ from what it already shows."""
+        if self._shown.get(label) != options:
+            label.config(**options)
+            self._shown[label] = options
+
+    def _set_readings(self, temp, humid, press, gas, status, status_fg, heater=None):
+        """Apply one sensor tick to the labels, then lay out and redraw once.
+
+        Args:
+            temp, humid, press, gas: Text for the four readout labels
+            status, status_fg: Status line text and colour
+            heater: Optional (text, colour) for the gas heater line; unchanged if None
+        """
+        for var, value in ((self.temp_var, temp), (self.humid_var, humid),
+                           (self.press_var, press), (self.gas_var, gas)):
+            # Variables aren't hashable; key by their Tcl name
+            if self._shown.get(str(var)) != value:
+                var.set(value)
+                self._shown[str(var)] = value
+        self._show(self.sensor_status, text=status, fg=status_fg)
+        if heater is not None:
+            self._show(self.gas_heater_status, text=heater[0], fg=heater[1])
+        self.root.update_idletasks()
 
-            self.temp_label.config(text=temp_str)
-            self.humid_label.config(text=humid_str)
-            self.press_label.config(text=press_str)
+    def update_sensor_readings(self, fut):
+        """Update sensor readings on main screen with error recovery and alert monitoring.
 
-            # Update gas label with status text
+        Args:
+            fut: Completed future holding the (h, t, p, g, formatted) tuple
+                from BME_SENSOR.read_all()
+        """
+        heater = None
+        try:
+            # Raw values and formatted strings come from one I2C acquisition
+            h, t, p, g, data = fut.result()
+
+            temp_str = data["temperature_str"]
+            humid_str = data["humidity_str"]
+            press_str = data["pressure_str"]
+
+            # Gas label shows status text
             gas_text = self.get_gas_label_text(g)
-            self.gas_label.config(text=gas_text)
 
             if t is None:
                 # Sensor not responding - increment error counter
@@ -597,10 +987,8 @@ class RPILauncherGUI:
                 else:
                     self.update_interval = 60000  # 60 sec - very slow
                 
-                self.sensor_status.config(
-                    text=f"⚠️ Sensor not connected (error #{self.sensor_error_count}, retry in {self.update_interval//1000}s)",
-                    fg='#ffaa00'
-                )
+                status = f"⚠️ Sensor not connected (error #{self.sensor_error_count}, retry in {self.update_interval//1000}s)"
+                status_fg = '#ffaa00'
             else:
                 # Success - reset error counter and interval
                 if self.sensor_error_count > 0:
@@ -609,18 +997,11 @@ class RPILauncherGUI:
                 self.sensor_error_count = 0
                 self.update_interval = 5000  # Reset to normal interval
                 
-                status_text = "✓ Last updated: " + self.get_current_time()
-                self.sensor_status.config(
-                    text=status_text,
-                    fg='#00aa00'
-                )
+                status = "✓ Last updated: " + time.strftime("%H:%M:%S")
+                status_fg = '#00aa00'
                 
-                # Update gas heater status with color coding
-                gas_status_text, gas_status_color = self.get_gas_heater_status(g)
-                self.gas_heater_status.config(
-                    text=gas_status_text,
-                    fg=gas_status_color
-                )
+                # Gas heater status with color coding
+                heater = self.get_gas_heater_status(g)
                 
                 # Check for alert conditions
                 self.check_sensor_alerts(h, t, p, g)
@@ -638,47 +1019,35 @@ class RPILauncherGUI:
                 self.update_interval = 60000  # 60 sec
             
             # Show error state with countdown
-            self.temp_label.config(text="Error")
-            self.humid_label.config(text="Error")
-            self.press_label.config(text="Error")
-            self.gas_label.config(text="Error")
-            self.sensor_status.config(
-                text=f"⚠️ Sensor error #{self.sensor_error_count} ({e.__class__.__name__}). Retry in {self.update_interval//1000}s",
-                fg='#ff6666'
-            )
+            temp_str = humid_str = press_str = gas_text = "Error"
+            status = f"⚠️ Sensor error #{self.sensor_error_count} ({e.__class__.__name__}). Retry in {self.update_interval//1000}s"
+            status_fg = '#ff6666'
         
-        # Schedule next update with current interval (may have changed due to errors)
-        self.root.after(self.update_interval, self.update_sensor_readings)
-    
-    def get_current_time(self):
-        """Get current time string."""
-        return datetime.now().strftime("%H:%M:%S")
+        self._set_readings(temp_str, humid_str, press_str, gas_text, status, status_fg, heater)
     
     def run_rf_script(self):
         """Launch TPMS RF Monitor GUI."""
+        global _TPMS_GUI_OK
+        from tkinter import messagebox
         logger.info("RF Monitor button pressed")
         
         try:
-            # Launch TPMS monitor in new window
-            rf_dir = os.path.join(BASE_DIR, 'rf')
-            tpms_gui_path = os.path.join(rf_dir, 'tpms_monitor_gui.py')
+            # Launch TPMS monitor in new window (re-stat only if it was missing,
+            # so a later install is picked up without a restart)
+            if not _TPMS_GUI_OK:
+                _TPMS_GUI_OK = os.path.isfile(TPMS_GUI_PATH)
             
-            if not os.path.isfile(tpms_gui_path):
-                logger.error(f"TPMS monitor not found: {tpms_gui_path}")
+            if not _TPMS_GUI_OK:
+                logger.error(f"TPMS monitor not found: {TPMS_GUI_PATH}")
                 messagebox.showerror(
                     "TPMS Monitor Not Found",
-                    f"TPMS monitor GUI not found at:\n{tpms_gui_path}"
+                    f"TPMS monitor GUI not found at:\n{TPMS_GUI_PATH}"
                 )
                 return
             
             # Launch TPMS monitor as standalone window
-            logger.info(f"Launching TPMS monitor: {tpms_gui_path}")
-            venv_python = os.path.join(BASE_DIR, '.venv', 'bin', 'python')
-            
-            if os.path.exists(venv_python):
-                subprocess.Popen([venv_python, tpms_gui_path])
-            else:
-                subprocess.Popen(['python3', tpms_gui_path])
+            logger.info(f"Launching TPMS monitor: {TPMS_GUI_PATH}")
+            self._launch([TPMS_PYTHON, TPMS_GUI_PATH], "launch TPMS monitor")
             
         except Exception as e:
             logger.error(f"Failed to launch TPMS monitor: {e}")
@@ -686,50 +1055,41 @@ class RPILauncherGUI:
     
     def test_beep(self):
         """Play test beep pattern."""
+        from tkinter import messagebox
         logger.info("Test beep button pressed")
         if SPEAKER.available:
             SPEAKER.test_beep()
         else:
-            messagebox.showwarning("Speaker Not Available", 
-                                   "Speaker hardware not initialized.\n"
-                                   "Ensure GPIO pin 12 is properly wired.")
+            messagebox.showwarning(*_MSGS['no_speaker'])
     
     def reboot_pi(self):
         """Reboot the Raspberry Pi after confirmation."""
+        from tkinter import messagebox
         logger.info("Reboot button pressed")
-        if messagebox.askyesno("Confirm Reboot", "Reboot Raspberry Pi now?"):
+        if messagebox.askyesno(*_MSGS['confirm_reboot']):
             logger.info("Reboot confirmed")
             if SPEAKER.available:
                 SPEAKER.beep_reboot()
-            try:
-                subprocess.Popen(['sudo', 'reboot'])
-            except Exception as e:
-                logger.error(f"Failed to reboot: {e}")
-                messagebox.showerror("Error", f"Failed to reboot:\n{e}")
+            self._submit(_reboot, lambda fut: self._report_launch(fut, "reboot"))
     
     def open_shell(self):
         """Open a terminal window."""
+        from tkinter import messagebox
         logger.info("Shell button pressed")
-        try:
-            # Try different terminal emulators using shutil.which (no subprocess)
-            terminals = ['x-terminal-emulator', 'xterm', 'lxterminal', 'gnome-terminal']
-            for term in terminals:
-                if shutil.which(term):
-                    subprocess.Popen([term])
-                    break
-            else:
-                messagebox.showwarning("No Terminal", "No terminal emulator found.\nInstall xterm: sudo apt install xterm")
-        except Exception as e:
-            logger.error(f"Failed to open shell: {e}")
-            messagebox.showerror("Error", f"Failed to open shell:\n{e}")
+        if _TERMINAL is None:
+            messagebox.showwarning(*_MSGS['no_term'])
+            return
+        self._launch([_TERMINAL], "open shell")
     
     def exit_app(self):
         """Exit the application."""
+        from tkinter import messagebox
         logger.info("Exit button pressed")
-        if messagebox.askyesno("Confirm Exit", "Exit RPI Lab GUI?"):
+        if messagebox.askyesno(*_MSGS['confirm_exit']):
             logger.info("Exit confirmed")
             if SPEAKER.available:
                 SPEAKER.beep_shutdown()
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
             try:
                 self.root.destroy()
             finally:
@@ -751,6 +1111,7 @@ def main():
     root = tk.Tk()
     app = RPILauncherGUI(root)
     
+    _pin_tk_thread()
     try:
         root.mainloop()
     except KeyboardInterrupt:
@@ -14,9 +14,9 @@ Options:
 
 import sys
 import time
+import bisect
 import argparse
 import os
-from datetime import datetime
 from typing import Optional
 
 # Add parent directory to path for imports
@@ -24,14 +24,79 @@ BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, BASE_DIR)
 
 from rich.console import Console
+from rich.control import Control
 from rich.layout import Layout
 from rich.live import Live
+from rich.segment import Segment
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
-from sensors.bme690 import BME690Sensor
+from sensors.bme690 import BME690Sensor, get_sensor
 
-console = Console()
+
+def make_console() -> Console:
+    """Console writing through a 64 KiB buffer, so each frame goes out in one write."""
+    try:
+        out = open(sys.stdout.fileno(), 'w', buffering=65536,
+                   encoding=sys.stdout.encoding, closefd=False)
+    except (AttributeError, OSError, ValueError):
+        # stdout without a real fd (e.g. captured by a test harness)
+        return Console()
+    return Console(file=out)
+
+
+console = make_console()
+
+
+def _raw_control(sequence: str) -> Control:
+    """Control renderable that emits an arbitrary escape sequence verbatim."""
+    control = Control()
+    control.segment = Segment(sequence)
+    return control
+
+
+# Synchronized output (DEC private mode 2026): the terminal holds the screen
+# between these markers and paints the frame in one go. Terminals without
+# support ignore the unknown mode, so no capability probe is needed.
+SYNC_BEGIN = _raw_control("\x1b[?2026h")
+SYNC_END = _raw_control("\x1b[?2026l")
+
+
+class SyncLive(Live):
+    """Live display whose refreshes are wrapped in synchronized-update markers."""
+
+    def refresh(self) -> None:
+        if not self.console.is_terminal or self.console.is_dumb_terminal:
+            super().refresh()
+            return
+        # Markers and frame share one console buffer, so they go out in one write
+        with self.console:
+            self.console.control(SYNC_BEGIN)
+            super().refresh()
+            self.console.control(SYNC_END)
+
+
+# Gas status bands: _GAS_STATUS[i] applies below _GAS_THRESHOLDS[i] (Ω);
+# the last entry covers everything above the highest threshold.
+# Entries are (formatter, color, value shown in kΩ)
+_GAS_THRESHOLDS = (5000, 10000, 20000, 40000, 60000, 100000)
+_GAS_STATUS = (
+    ("⚠️  Gas Detected ({:.0f} Ω)".format, "red", False),
+    ("🔥 Initial Warm-Up ({:.1f} kΩ)".format, "bright_red", True),
+    ("⏳ Stabilizing ({:.1f} kΩ)".format, "yellow", True),
+    ("📈 Continued Stabilization ({:.1f} kΩ)".format, "bright_yellow", True),
+    ("🔄 Further Stabilization ({:.1f} kΩ)".format, "bright_green", True),
+    ("✅ Stabilized ({:.1f} kΩ)".format, "green", True),
+    ("✓ Normal Operation ({:.1f} kΩ)".format, "bright_green", True),
+)
+
+# Minimum change in (humidity %RH, temperature °C, pressure hPa, gas Ω)
+# that is worth redrawing for; smaller drift waits for the heartbeat
+CHANGE_THRESHOLDS = (0.1, 0.05, 0.1, 100.0)
+# Redraw at least this often so the "Updated" timestamp stays honest
+HEARTBEAT_SECONDS = 30.0
+# Never push frames faster than ~30 fps, even with a tiny --interval
+MIN_FRAME_SECONDS = 1 / 30
 
 
 def get_gas_status_text(gas_resistance: Optional[float]) -> tuple[str, str]:
@@ -43,28 +108,29 @@ def get_gas_status_text(gas_resistance: Optional[float]) -> tuple[str, str]:
     if gas_resistance is None:
         return "N/A", "white"
     
-    gas_kohm = gas_resistance / 1000.0
-    
-    if gas_resistance < 5000:
-        return f"⚠️  Gas Detected ({gas_resistance:.0f} Ω)", "red"
-    elif gas_resistance < 10000:
-        return f"🔥 Initial Warm-Up ({gas_kohm:.1f} kΩ)", "bright_red"
-    elif gas_resistance < 20000:
-        return f"⏳ Stabilizing ({gas_kohm:.1f} kΩ)", "yellow"
-    elif gas_resistance < 40000:
-        return f"📈 Continued Stabilization ({gas_kohm:.1f} kΩ)", "bright_yellow"
-    elif gas_resistance < 60000:
-        return f"🔄 Further Stabilization ({gas_kohm:.1f} kΩ)", "bright_green"
-    elif gas_resistance < 100000:
-        return f"✅ Stabilized ({gas_kohm:.1f} kΩ)", "green"
-    else:
-        return f"✓ Normal Operation ({gas_kohm:.1f} kΩ)", "bright_green"
+    fmt, color, in_kohm = _GAS_STATUS[bisect.bisect_right(_GAS_THRESHOLDS, gas_resistance)]
+    return fmt(gas_resistance / 1000.0 if in_kohm else gas_resistance), color
+
+
+def readings_changed(old, new) -> bool:
+    """True if any of (h, t, p, g) moved by at least its display threshold."""
+    if old is None:
+        return True
+    for prev, cur, eps in zip(old, new, CHANGE_THRESHOLDS):
+        if (prev is None) != (cur is None):
+            return True
+        if cur is not None and abs(cur - prev) >= eps:
+            return True
+    return False
 
 
 def create_sensor_panel(sensor: BME690Sensor) -> Panel:
-    """Create sensor data panel."""
-    h, t, p, g = sensor.read()
-    
+    """Create sensor data panel from a fresh sensor read."""
+    return build_sensor_panel(*sensor.read())
+
+
+def build_sensor_panel(h, t, p, g) -> Panel:
+    """Create sensor data panel from already-read values."""
     table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column("Metric", style="cyan bold")
     table.add_column("Value", style="white bold")
@@ -87,7 +153,7 @@ def create_sensor_panel(sensor: BME690Sensor) -> Panel:
     gas_status, gas_color = get_gas_status_text(g)
     table.add_row("💨  Gas Status:", Text(gas_status, style=gas_color))
     
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
     
     return Panel(
         table,
@@ -176,7 +242,7 @@ def main():
     show_rf = args.rf or args.both
     
     # Initialize sensor
-    sensor = BME690Sensor()
+    sensor = get_sensor()
     
     if not sensor.available:
         console.print("[red]❌ BME690 sensor not available![/red]")
@@ -187,37 +253,64 @@ def main():
     console.print(f"[cyan]Update interval: {args.interval}s[/cyan]")
     console.print("[dim]Press Ctrl+C to exit[/dim]\n")
     
+    # Layout, header and footer never change - build them once and only
+    # swap the body panels on each refresh
+    layout = create_layout(show_sensor, show_rf)
+    layout["header"].update(create_header())
+    
+    footer_text = Text()
+    footer_text.append("Press ", style="dim")
+    footer_text.append("Ctrl+C", style="bold red")
+    footer_text.append(" to exit", style="dim")
+    footer_text.append(" | Refreshing every ", style="dim")
+    footer_text.append(f"{args.interval}s", style="bold cyan")
+    layout["footer"].update(Panel(footer_text, style="dim"))
+    
+    # The RF panel has no live data source yet, so it is static: place it once
+    if show_rf:
+        rf_region = layout["body"]["rf"] if show_sensor else layout["body"]
+        rf_region.update(create_rf_panel())
+    
     try:
-        with Live(console=console, screen=True, auto_refresh=False) as live:
+        with SyncLive(layout, console=console, screen=True, auto_refresh=False) as live:
+            shown = None  # (h, t, p, g) on screen
+            shown_size = None  # console size the frame on screen was laid out for
+            last_render = None
+            # Ticks run against a monotonic deadline so read/render time
+            # doesn't stretch the interval
+            deadline = time.monotonic()
             while True:
-                layout = create_layout(show_sensor, show_rf)
-                
-                # Update header
-                layout["header"].update(create_header())
-                
-                # Update body
-                if show_sensor:
-                    if show_rf:
-                        layout["body"]["sensor"].update(create_sensor_panel(sensor))
-                        layout["body"]["rf"].update(create_rf_panel())
-                    else:
-                        layout["body"].update(create_sensor_panel(sensor))
-                else:
-                    layout["body"].update(create_rf_panel())
-                
-                # Update footer
-                footer_text = Text()
-                footer_text.append("Press ", style="dim")
-                footer_text.append("Ctrl+C", style="bold red")
-                footer_text.append(" to exit", style="dim")
-                footer_text.append(" | Refreshing every ", style="dim")
-                footer_text.append(f"{args.interval}s", style="bold cyan")
+                readings = sensor.read() if show_sensor else None
+                now = time.monotonic()
+                size = console.size
                 
-                layout["footer"].update(Panel(footer_text, style="dim"))
+                # Only rebuild the sensor panel and push a frame when something
+                # visible changed - saves bandwidth over SSH. A terminal resize
+                # always redraws. The heartbeat only matters with the sensor
+                # panel shown: it refreshes its "Updated" timestamp, while an
+                # RF-only frame never changes otherwise.
+                if last_render is not None and now - last_render < MIN_FRAME_SECONDS:
+                    pass  # Frame cap - a pending change is drawn on a later tick
+                elif (last_render is None
+                        or size != shown_size
+                        or (show_sensor and (now - last_render >= HEARTBEAT_SECONDS
+                                             or readings_changed(shown, readings)))):
+                    if show_sensor:
+                        sensor_region = layout["body"]["sensor"] if show_rf else layout["body"]
+                        sensor_region.update(build_sensor_panel(*readings))
+                    
+                    live.refresh()
+                    shown = readings
+                    shown_size = size
+                    last_render = now
                 
-                live.update(layout)
-                live.refresh()
-                time.sleep(args.interval)
+                deadline += args.interval
+                delay = deadline - time.monotonic()
+                if delay < 0:
+                    # Fell behind (slow read or suspend) - don't burst to catch up
+                    deadline = time.monotonic()
+                    delay = 0
+                time.sleep(delay)
                 
     except KeyboardInterrupt:
         console.print("\n[yellow]✓ TUI Monitor stopped[/yellow]")
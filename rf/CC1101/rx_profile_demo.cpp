@@ -6,9 +6,14 @@
 #include <time.h>
 #include <sys/stat.h>
 #include <signal.h>
+#include <unistd.h>
 
 // Simple CSV packet logger and Manchester decoder for TPMS
 
+// Binary packet record written to stdout with -B (one write() per packet):
+//   uint8_t len; int8_t rssi; uint8_t lqi; uint8_t data[len];
+static int g_binary_fd = -1;
+
 static FILE *g_logfile = NULL;
 static volatile int g_running = 1;
 
@@ -73,6 +78,7 @@ static int manchester_decode_bytes(const uint8_t *data, int len, uint8_t *outbuf
 //   -addr <dec>      Set node address (default 1)
 //   -freq <1|2|3|4>  ISM band: 1=315,2=433,3=868,4=915 (profile overrides may retune)
 //   -channel <n>     Channel number (default 0)
+//   -B               Binary packet records on stdout; text output moves to stderr
 // Profiles added:
 //   TPMS (mode 0x07) and IoT (mode 0x08)
 
@@ -83,6 +89,7 @@ static void usage() {
     printf("  -addr <dec>       Node address (default 1)\n");
     printf("  -freq <1|2|3|4>   ISM band select (default 3=868)\n");
     printf("  -channel <n>      Channel (default 0)\n");
+    printf("  -B                Binary packet records on stdout (text goes to stderr)\n");
     printf("  -h                Help\n");
 }
 
@@ -91,6 +98,7 @@ int main(int argc, char *argv[]) {
     int mode = 0x03;          // default GFSK_100_kb
     int freq = 0x03;          // default 868.3 MHz
     int channel = 0;          // default channel
+    int binary = 0;           // -B: binary packet records on stdout
 
     for(int i=1;i<argc;i++) {
         if(strcmp(argv[i],"-h")==0) { usage(); return 0; }
@@ -101,6 +109,7 @@ int main(int argc, char *argv[]) {
         else if(strcmp(argv[i],"-addr")==0 && i+1<argc) { addr = (uint8_t)atoi(argv[++i]); }
         else if(strcmp(argv[i],"-freq")==0 && i+1<argc) { freq = atoi(argv[++i]); }
         else if(strcmp(argv[i],"-channel")==0 && i+1<argc) { channel = atoi(argv[++i]); }
+        else if(strcmp(argv[i],"-B")==0) { binary = 1; }
         else {
             printf("Unknown argument: %s\n", argv[i]);
             usage();
@@ -108,6 +117,13 @@ int main(int argc, char *argv[]) {
         }
     }
 
+    if(binary) {
+        // Keep the pipe for packet records; everything printed goes to stderr
+        fflush(stdout);
+        g_binary_fd = dup(STDOUT_FILENO);
+        dup2(STDERR_FILENO, STDOUT_FILENO);
+    }
+
     CC1100 radio;
     radio.set_debug_level(1);
 
@@ -190,7 +206,19 @@ int main(int argc, char *argv[]) {
                     fflush(logf);
                 }
 
-                printf("%s MODE=0x%02X LEN=%d RSSI=%d LQI=%d HEX=%s DECODE=%s %s\n", timestr, mode, pktlen, rssi, lqi, hexdump, decoded, fields);
+                if(g_binary_fd >= 0) {
+                    uint8_t rec[3 + sizeof(rxbuf)];
+                    uint8_t n = pktlen <= sizeof(rxbuf) ? pktlen : sizeof(rxbuf);
+                    rec[0] = n;
+                    rec[1] = (uint8_t)rssi;
+                    rec[2] = lqi;
+                    memcpy(rec + 3, rxbuf, n);
+                    if(write(g_binary_fd, rec, 3 + n) < 0) {
+                        g_running = 0;  // reader went away
+                    }
+                } else {
+                    printf("%s MODE=0x%02X LEN=%d RSSI=%d LQI=%d HEX=%s DECODE=%s %s\n", timestr, mode, pktlen, rssi, lqi, hexdump, decoded, fields);
+                }
             }
         }
     }
@@ -19,16 +19,76 @@ Typical TPMS packet structure:
 Manchester encoding: Each data bit encoded as two physical bits (10=0, 01=1)
 """
 
+import os
+import csv
+import time
 import struct
 import logging
 from typing import Optional, Dict, Tuple, List
-from dataclasses import dataclass
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 
 logger = logging.getLogger(__name__)
 
+# Protocol, supplier and transmission labels attached to decoded readings
+PROTOCOL_SCHRADER = "Schrader"
+PROTOCOL_SIEMENS = "Siemens/VDO"
+PROTOCOL_GENERIC_MANCHESTER = "Generic-Manchester"
+PROTOCOL_UNKNOWN = "Unknown"
+SUPPLIER_SCHRADER = "Schrader Electronics"
+SUPPLIER_SIEMENS = "Siemens/Continental"
+TRANSMISSION_PERIODIC_EVENT = "Periodic (60s) + Event-driven"
 
-@dataclass
+# Pressure unit conversion factors
+_KPA_TO_PSI = 0.145038
+_PSI_TO_KPA = 1.0 / _KPA_TO_PSI
+
+# Plausible ranges for decoded tyre readings
+MIN_PRESSURE_KPA = 50.0   # ~7 PSI
+MAX_PRESSURE_KPA = 500.0  # ~72 PSI
+MIN_TEMP_C = -40.0
+MAX_TEMP_C = 125.0
+
+
+def _plausible(pressure_kpa: float, temperature_c: float) -> bool:
+    """True if pressure and temperature are within sensor ranges (exclusive)."""
+    return (MIN_PRESSURE_KPA < pressure_kpa < MAX_PRESSURE_KPA
+            and MIN_TEMP_C < temperature_c < MAX_TEMP_C)
+
+
+# Display colour for each pressure status
+_PRESSURE_COLORS = {
+    "CRITICAL": "#ff0000",  # Red
+    "LOW": "#ff9900",       # Orange
+    "NORMAL": "#00ff00",    # Green
+    "HIGH": "#ffff00",      # Yellow
+    "UNKNOWN": "#666666"    # Gray
+}
+
+
+def _build_manchester_table() -> bytes:
+    """Map each byte holding four valid Manchester pairs to its 4-bit value.
+
+    Bytes containing an invalid pair (00 or 11) map to 0xFF.
+    """
+    table = bytearray(b'\xff' * 256)
+    for nibble in range(16):
+        encoded = 0
+        for shift in range(3, -1, -1):
+            encoded = (encoded << 2) | (0b01 if (nibble >> shift) & 1 else 0b10)
+        table[encoded] = nibble
+    return bytes(table)
+
+
+# Precompiled big-endian field layouts shared by the protocol decoders
+_U32_BE = struct.Struct('>I')
+_U16_BE = struct.Struct('>H')
+
+# bytes.translate() table for decoding clean, byte-aligned Manchester data
+_MANCHESTER_NIBBLE = _build_manchester_table()
+
+
+@dataclass(slots=True)
 class TPMSReading:
     """Decoded TPMS sensor reading"""
     sensor_id: str
@@ -38,25 +98,33 @@ class TPMSReading:
     battery_low: Optional[bool] = None
     signal_strength: Optional[int] = None  # RSSI
     link_quality: Optional[int] = None  # LQI
-    protocol: str = "Unknown"
+    protocol: str = PROTOCOL_UNKNOWN
     raw_hex: str = ""
     timestamp: str = ""
     supplier: Optional[str] = None  # e.g., "Schrader", "Siemens", "Continental"
     transmission_type: Optional[str] = None  # e.g., "Periodic", "Event-driven"
+    # Derived from pressure_psi once in __post_init__
+    _pressure_status: str = field(default="UNKNOWN", init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.timestamp:
-            self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         
         # Auto-convert between kPa and PSI
-        if self.pressure_kpa and not self.pressure_psi:
-            self.pressure_psi = self.pressure_kpa * 0.145038
-        elif self.pressure_psi and not self.pressure_kpa:
-            self.pressure_kpa = self.pressure_psi / 0.145038
+        if self.pressure_psi is None and self.pressure_kpa is not None:
+            self.pressure_psi = self.pressure_kpa * _KPA_TO_PSI
+        elif self.pressure_kpa is None and self.pressure_psi is not None:
+            self.pressure_kpa = self.pressure_psi * _PSI_TO_KPA
+        
+        self._pressure_status = self._compute_pressure_status()
     
     def get_pressure_status(self) -> str:
         """Get pressure status indicator"""
-        if not self.pressure_psi:
+        return self._pressure_status
+    
+    def _compute_pressure_status(self) -> str:
+        """Classify pressure_psi into a status indicator"""
+        if self.pressure_psi is None:
             return "UNKNOWN"
         if self.pressure_psi < 26:
             return "CRITICAL"
@@ -69,30 +137,22 @@ class TPMSReading:
     
     def get_pressure_color(self) -> str:
         """Get color code for pressure status"""
-        status = self.get_pressure_status()
-        color_map = {
-            "CRITICAL": "#ff0000",  # Red
-            "LOW": "#ff9900",       # Orange
-            "NORMAL": "#00ff00",    # Green
-            "HIGH": "#ffff00",      # Yellow
-            "UNKNOWN": "#666666"    # Gray
-        }
-        return color_map.get(status, "#666666")
+        return _PRESSURE_COLORS[self._pressure_status]
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for logging/display"""
         return {
             'timestamp': self.timestamp,
             'sensor_id': self.sensor_id,
-            'pressure_kpa': round(self.pressure_kpa, 2) if self.pressure_kpa else None,
-            'pressure_psi': round(self.pressure_psi, 2) if self.pressure_psi else None,
-            'temperature_c': round(self.temperature_c, 1) if self.temperature_c else None,
+            'pressure_kpa': round(self.pressure_kpa, 2) if self.pressure_kpa is not None else None,
+            'pressure_psi': round(self.pressure_psi, 2) if self.pressure_psi is not None else None,
+            'temperature_c': round(self.temperature_c, 1) if self.temperature_c is not None else None,
             'battery_low': self.battery_low,
             'rssi': self.signal_strength,
             'lqi': self.link_quality,
             'protocol': self.protocol,
             'supplier': self.supplier,
-            'pressure_status': self.get_pressure_status(),
+            'pressure_status': self._pressure_status,
             'raw_hex': self.raw_hex
         }
 
@@ -126,16 +186,23 @@ class TPMSDecoder:
         raw_hex = raw_bytes.hex().upper()
         self.logger.debug(f"Decoding packet: {raw_hex}")
         
-        # Try different protocol decoders
+        # Manchester-decode once; every protocol extractor works on the same result
+        decoded = self._manchester_decode(raw_bytes)
+        if not decoded:
+            return self._decode_generic(raw_bytes, rssi, lqi, raw_hex)
+        
+        # Try different protocol extractors (Schrader frames need >= 9 raw bytes)
         decoders = [
-            self._decode_schrader,
-            self._decode_siemens,
-            self._decode_generic_manchester
+            self._extract_schrader,
+            self._extract_siemens,
+            self._extract_generic_manchester
         ]
+        if len(raw_bytes) < 9:
+            decoders.remove(self._extract_schrader)
         
         for decoder in decoders:
             try:
-                result = decoder(raw_bytes)
+                result = decoder(decoded)
                 if result:
                     result.signal_strength = rssi
                     result.link_quality = lqi
@@ -148,9 +215,9 @@ class TPMSDecoder:
         # If no decoder worked, return generic info
         return self._decode_generic(raw_bytes, rssi, lqi, raw_hex)
     
-    def _decode_schrader(self, data: bytes) -> Optional[TPMSReading]:
+    def _extract_schrader(self, decoded: bytes) -> Optional[TPMSReading]:
         """
-        Decode Schrader TPMS protocol (common in US/European vehicles)
+        Extract Schrader TPMS fields (common in US/European vehicles)
         
         Typical format (after Manchester decode):
         Bytes 0-3: Sensor ID (32-bit)
@@ -160,19 +227,13 @@ class TPMSDecoder:
         Byte 7: Temperature (°C + 40)
         Byte 8: CRC/checksum
         """
-        # Check for Schrader sync pattern
-        if len(data) < 9:
-            return None
-        
-        # Manchester decode if needed (simplified - assumes pre-decoded)
-        decoded = self._manchester_decode(data)
-        if not decoded or len(decoded) < 8:
+        if len(decoded) < 8:
             return None
         
         # Extract fields
-        sensor_id = struct.unpack('>I', decoded[0:4])[0]  # Big-endian 32-bit ID
+        sensor_id = _U32_BE.unpack_from(decoded, 0)[0]  # Big-endian 32-bit ID
         status = decoded[4]
-        pressure_raw = struct.unpack('>H', decoded[5:7])[0]  # Big-endian 16-bit
+        pressure_raw = _U16_BE.unpack_from(decoded, 5)[0]  # Big-endian 16-bit
         temp_raw = decoded[7]
         
         # Convert pressure (typically kPa * 4)
@@ -185,9 +246,7 @@ class TPMSDecoder:
         battery_low = bool(status & 0x80)
         
         # Sanity check ranges
-        if not (50 < pressure_kpa < 500):  # ~7-72 PSI
-            return None
-        if not (-40 < temperature_c < 125):
+        if not _plausible(pressure_kpa, temperature_c):
             return None
         
         return TPMSReading(
@@ -195,14 +254,14 @@ class TPMSDecoder:
             pressure_kpa=pressure_kpa,
             temperature_c=temperature_c,
             battery_low=battery_low,
-            protocol="Schrader",
-            supplier="Schrader Electronics",
-            transmission_type="Periodic (60s) + Event-driven"
+            protocol=PROTOCOL_SCHRADER,
+            supplier=SUPPLIER_SCHRADER,
+            transmission_type=TRANSMISSION_PERIODIC_EVENT
         )
     
-    def _decode_siemens(self, data: bytes) -> Optional[TPMSReading]:
+    def _extract_siemens(self, decoded: bytes) -> Optional[TPMSReading]:
         """
-        Decode Siemens/VDO/Continental TPMS protocol
+        Extract Siemens/VDO/Continental TPMS fields
         
         Typical format:
         Bytes 0-3: Sensor ID
@@ -211,14 +270,13 @@ class TPMSDecoder:
         Byte 7: Status/battery
         Byte 8: CRC
         """
-        decoded = self._manchester_decode(data)
-        if not decoded or len(decoded) < 8:
+        if len(decoded) < 8:
             return None
         
-        sensor_id = struct.unpack('>I', decoded[0:4])[0]
+        sensor_id = _U32_BE.unpack_from(decoded, 0)[0]
         
         # Siemens uses different pressure encoding (kPa - 100)
-        pressure_raw = struct.unpack('>H', decoded[4:6])[0]
+        pressure_raw = _U16_BE.unpack_from(decoded, 4)[0]
         pressure_kpa = (pressure_raw / 100.0) + 100.0
         
         # Temperature (°C + 50)
@@ -229,9 +287,7 @@ class TPMSDecoder:
         battery_low = bool(status & 0x01)
         
         # Sanity checks
-        if not (50 < pressure_kpa < 500):
-            return None
-        if not (-40 < temperature_c < 125):
+        if not _plausible(pressure_kpa, temperature_c):
             return None
         
         return TPMSReading(
@@ -239,22 +295,21 @@ class TPMSDecoder:
             pressure_kpa=pressure_kpa,
             temperature_c=temperature_c,
             battery_low=battery_low,
-            protocol="Siemens/VDO",
-            supplier="Siemens/Continental",
-            transmission_type="Periodic (60s) + Event-driven"
+            protocol=PROTOCOL_SIEMENS,
+            supplier=SUPPLIER_SIEMENS,
+            transmission_type=TRANSMISSION_PERIODIC_EVENT
         )
     
-    def _decode_generic_manchester(self, data: bytes) -> Optional[TPMSReading]:
+    def _extract_generic_manchester(self, decoded: bytes) -> Optional[TPMSReading]:
         """
-        Generic Manchester decoder for unknown TPMS protocols
+        Generic extractor for unknown Manchester-encoded TPMS protocols
         Attempts to extract sensor ID and basic data
         """
-        decoded = self._manchester_decode(data)
-        if not decoded or len(decoded) < 6:
+        if len(decoded) < 6:
             return None
         
         # Assume first 4 bytes are sensor ID
-        sensor_id = struct.unpack('>I', decoded[0:4])[0]
+        sensor_id = _U32_BE.unpack_from(decoded, 0)[0]
         
         # Try to guess pressure and temp from remaining bytes
         if len(decoded) >= 7:
@@ -266,12 +321,12 @@ class TPMSDecoder:
             pressure_kpa = pressure_raw * 1.37  # Common multiplier
             temperature_c = temp_raw - 40.0
             
-            if 50 < pressure_kpa < 500 and -40 < temperature_c < 125:
+            if _plausible(pressure_kpa, temperature_c):
                 return TPMSReading(
                     sensor_id=f"{sensor_id:08X}",
                     pressure_kpa=pressure_kpa,
                     temperature_c=temperature_c,
-                    protocol="Generic-Manchester"
+                    protocol=PROTOCOL_GENERIC_MANCHESTER
                 )
         
         return None
@@ -289,7 +344,7 @@ class TPMSDecoder:
             sensor_id=sensor_id,
             signal_strength=rssi,
             link_quality=lqi,
-            protocol="Unknown",
+            protocol=PROTOCOL_UNKNOWN,
             raw_hex=raw_hex
         )
     
@@ -306,75 +361,101 @@ class TPMSDecoder:
         if len(data) < 2:
             return None
         
-        # For now, return simplified byte-level decode
-        # TODO: Implement proper bit-level Manchester decoding with sync detection
-        
-        # Simple approach: assume data is already decoded or use every other bit
-        result = bytearray()
+        # Fast path: every pair valid and aligned - decode 4 bits per input
+        # byte with one C-level translate, two nibbles per output byte
+        if len(data) >= 8:
+            nibbles = data.translate(_MANCHESTER_NIBBLE)
+            if 0xFF not in nibbles:
+                return bytes((hi << 4) | lo for hi, lo in zip(nibbles[::2], nibbles[1::2]))
         
-        # Try bit-level decode
-        bit_string = ''.join(format(byte, '08b') for byte in data)
+        # TODO: Implement proper bit-level Manchester decoding with sync detection
         
-        # Look for Manchester pairs (01 or 10)
+        # Bit-level scan over the frame as one big-endian integer
+        nbits = len(data) * 8
+        frame = int.from_bytes(data, 'big')
+        out = 0
+        count = 0
         i = 0
-        decoded_bits = []
-        while i < len(bit_string) - 1:
-            pair = bit_string[i:i+2]
-            if pair == '10':
-                decoded_bits.append('0')
-                i += 2
-            elif pair == '01':
-                decoded_bits.append('1')
-                i += 2
+        while i < nbits - 1:
+            pair = (frame >> (nbits - 2 - i)) & 0b11
+            if pair == 0b10:
+                out <<= 1
+            elif pair == 0b01:
+                out = (out << 1) | 1
             else:
                 # Invalid Manchester encoding, skip this bit
                 i += 1
+                continue
+            count += 1
+            i += 2
         
-        # Convert decoded bits back to bytes
-        if len(decoded_bits) >= 8:
-            for i in range(0, len(decoded_bits) - 7, 8):
-                byte_bits = ''.join(decoded_bits[i:i+8])
-                result.append(int(byte_bits, 2))
-        
-        if len(result) >= 4:
-            return bytes(result)
+        # Keep whole decoded bytes only
+        nbytes = count // 8
+        if nbytes >= 4:
+            return (out >> (count - nbytes * 8)).to_bytes(nbytes, 'big')
         
         # Fallback: return original data (may already be decoded)
         return data
 
 
-def parse_csv_log(log_file: str) -> List[TPMSReading]:
+def _decode_hex_frames(hex_frames: List[str]) -> List[Optional[TPMSReading]]:
+    """Decode a batch of hex-encoded frames (also used as a worker-process task)."""
+    decoder = TPMSDecoder()
+    results: List[Optional[TPMSReading]] = []
+    for raw_hex in hex_frames:
+        # Convert hex string to bytes
+        try:
+            raw_bytes = bytes.fromhex(raw_hex)
+        except ValueError:
+            results.append(None)
+            continue
+        results.append(decoder.decode_packet(raw_bytes))
+    return results
+
+
+# parse_csv_log only fans out to worker processes when there are at least
+# this many distinct frames; below it, process startup costs more than it saves
+PARALLEL_MIN_FRAMES = 4096
+PARALLEL_CHUNK = 1024
+
+
+def parse_csv_log(log_file: str, workers: Optional[int] = None) -> List[TPMSReading]:
     """
     Parse TPMS data from rx_profile_demo CSV log file
     
     CSV format: timestamp,mode,raw_len,raw_hex,decoded,fields
+    
+    Sensors repeat the same frame many times, so each distinct raw_hex is
+    decoded once and later rows get a copy with their own timestamp. Large
+    logs decode their distinct frames across a process pool.
+    
+    Args:
+        log_file: Path to the CSV log
+        workers: Decoder processes for large logs (None = one per CPU,
+                 1 = always decode in this process)
     """
-    decoder = TPMSDecoder()
     readings = []
     
     try:
-        with open(log_file, 'r') as f:
+        with open(log_file, 'r', newline='') as f:
+            rows = csv.reader(f)
             # Skip header
-            next(f)
-            
-            for line in f:
-                parts = line.strip().split(',')
-                if len(parts) < 4:
-                    continue
-                
-                timestamp, mode, raw_len, raw_hex = parts[0:4]
-                
-                # Convert hex string to bytes
-                try:
-                    raw_bytes = bytes.fromhex(raw_hex)
-                except ValueError:
-                    continue
-                
-                # Decode packet
-                reading = decoder.decode_packet(raw_bytes)
-                if reading:
-                    reading.timestamp = timestamp
-                    readings.append(reading)
+            next(rows)
+            entries = [(parts[0].strip(), parts[3].strip()) for parts in rows if len(parts) >= 4]
+        
+        distinct = list(dict.fromkeys(raw_hex for _, raw_hex in entries))
+        if len(distinct) >= PARALLEL_MIN_FRAMES and (workers or os.cpu_count() or 1) > 1:
+            chunks = [distinct[i:i + PARALLEL_CHUNK] for i in range(0, len(distinct), PARALLEL_CHUNK)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = [r for chunk in pool.map(_decode_hex_frames, chunks) for r in chunk]
+        else:
+            results = _decode_hex_frames(distinct)
+        decoded = dict(zip(distinct, results))
+        
+        for timestamp, raw_hex in entries:
+            reading = decoded[raw_hex]
+            if reading:
+                readings.append(replace(reading, timestamp=timestamp))
     
     except Exception as e:
         logger.error(f"Failed to parse log file: {e}")
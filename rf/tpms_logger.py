@@ -9,6 +9,7 @@ import csv
 import json
 import logging
 import os
+import re
 from datetime import datetime
 from typing import List, Dict, Optional
 from pathlib import Path
@@ -17,6 +18,31 @@ from .tpms_decoder import TPMSReading
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+CSV_FIELDNAMES = (
+    'timestamp', 'sensor_id', 'pressure_psi', 'pressure_kpa',
+    'temperature_c', 'temperature_f', 'battery_low',
+    'rssi', 'lqi', 'protocol', 'supplier', 'pressure_status'
+)
+LOG_BUFFER_SIZE = 1 << 20
+
+# Matches csv.writer's default dialect (QUOTE_MINIMAL, '\r\n' terminator)
+# for rows whose text fields hold none of _CSV_NEEDS_QUOTING
+_CSV_ROW_FORMAT = ','.join(['%s'] * len(CSV_FIELDNAMES)) + '\r\n'
+_CSV_NEEDS_QUOTING = re.compile(r'[,"\r\n]')
+
+
+def _json_bytes(obj, indent: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode()
+
 
 class TPMSLogger:
     """Handles logging of TPMS sensor readings to CSV and JSON formats"""
@@ -44,26 +70,65 @@ class TPMSLogger:
         self.readings: List[TPMSReading] = []
         self.csv_written = False
         
+        # Session CSV is appended as readings arrive; opened on first reading
+        self._csv_fh = None
+        self._csv_writer = None
+        self._csv_started = False
+        
         logger.info(f"TPMS Logger initialized: {self.log_dir}")
     
     def add_reading(self, reading: TPMSReading) -> None:
         """Add a TPMS reading to the session log"""
         self.readings.append(reading)
+        self._append_csv((reading,))
     
     def add_readings(self, readings: List[TPMSReading]) -> None:
         """Add multiple TPMS readings"""
         self.readings.extend(readings)
+        self._append_csv(readings)
+    
+    def _append_csv(self, readings) -> None:
+        """Append rows to the session CSV, opening it (and writing the header) on first use"""
+        if self._csv_writer is None:
+            mode = 'a' if self._csv_started else 'w'
+            self._csv_fh = open(self.csv_file, mode, newline='', buffering=LOG_BUFFER_SIZE)
+            self._csv_writer = csv.writer(self._csv_fh)
+            if not self._csv_started:
+                self._csv_writer.writerow(CSV_FIELDNAMES)
+                self._csv_started = True
+        self._write_rows(self._csv_fh, self._csv_writer, readings)
+    
+    def close(self) -> None:
+        """Flush and close the session CSV"""
+        if self._csv_fh is not None:
+            self._csv_fh.close()
+            self._csv_fh = None
+            self._csv_writer = None
+    
+    def __enter__(self) -> 'TPMSLogger':
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
     
     def write_csv(self, overwrite: bool = True) -> Path:
         """
         Write all readings to CSV file
         
+        Readings are appended to the session CSV as they are added, so while
+        that file is open this only flushes it.
+        
         Args:
             overwrite: Whether to overwrite existing file
             
         Returns:
             Path to CSV file
         """
+        if self._csv_fh is not None:
+            self._csv_fh.flush()
+            self.csv_written = True
+            return self.csv_file
+        
         if not overwrite and self.csv_file.exists():
             logger.warning(f"CSV file exists, skipping: {self.csv_file}")
             return self.csv_file
@@ -73,35 +138,11 @@ class TPMSLogger:
             return self.csv_file
         
         try:
-            with open(self.csv_file, 'w', newline='') as f:
-                fieldnames = [
-                    'timestamp', 'sensor_id', 'pressure_psi', 'pressure_kpa',
-                    'temperature_c', 'temperature_f', 'battery_low',
-                    'rssi', 'lqi', 'protocol', 'supplier', 'pressure_status'
-                ]
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                
-                # Write header
-                writer.writeheader()
-                
-                # Write data rows
-                for reading in self.readings:
-                    temp_f = reading.temperature_c * 9/5 + 32 if reading.temperature_c else None
-                    row = {
-                        'timestamp': reading.timestamp,
-                        'sensor_id': reading.sensor_id,
-                        'pressure_psi': f"{reading.pressure_psi:.2f}" if reading.pressure_psi else "",
-                        'pressure_kpa': f"{reading.pressure_kpa:.2f}" if reading.pressure_kpa else "",
-                        'temperature_c': f"{reading.temperature_c:.1f}" if reading.temperature_c else "",
-                        'temperature_f': f"{temp_f:.1f}" if temp_f else "",
-                        'battery_low': reading.battery_low,
-                        'rssi': reading.signal_strength,
-                        'lqi': reading.link_quality,
-                        'protocol': reading.protocol,
-                        'supplier': reading.supplier or "",
-                        'pressure_status': reading.get_pressure_status()
-                    }
-                    writer.writerow(row)
+            # Large buffer: rows are small and written back to back
+            with open(self.csv_file, 'w', newline='', buffering=LOG_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_FIELDNAMES)
+                self._write_rows(f, writer, self.readings)
             
             logger.info(f"CSV log written: {self.csv_file} ({len(self.readings)} readings)")
             self.csv_written = True
@@ -111,6 +152,46 @@ class TPMSLogger:
             logger.error(f"Failed to write CSV: {e}")
             raise
     
+    @staticmethod
+    def _write_rows(f, writer, readings) -> None:
+        """Write one CSV row per reading, in CSV_FIELDNAMES order
+        
+        Rows are formatted straight into the file; the csv writer is only used
+        for a row whose text fields would need quoting.
+        """
+        write = f.write
+        needs_quoting = _CSV_NEEDS_QUOTING.search
+        for r in readings:
+            psi = r.pressure_psi
+            kpa = r.pressure_kpa
+            temp_c = r.temperature_c
+            if temp_c is None:
+                temp_c_text = temp_f_text = ""
+            else:
+                temp_c_text = f"{temp_c:.1f}"
+                temp_f_text = f"{temp_c * 1.8 + 32:.1f}"
+            battery = r.battery_low
+            rssi = r.signal_strength
+            lqi = r.link_quality
+            row = (
+                r.timestamp,
+                r.sensor_id,
+                "" if psi is None else f"{psi:.2f}",
+                "" if kpa is None else f"{kpa:.2f}",
+                temp_c_text,
+                temp_f_text,
+                "" if battery is None else battery,
+                "" if rssi is None else rssi,
+                "" if lqi is None else lqi,
+                r.protocol,
+                r.supplier or "",
+                r.get_pressure_status(),
+            )
+            if needs_quoting(f"{row[0]}{row[1]}{row[9]}{row[10]}"):
+                writer.writerow(row)
+            else:
+                write(_CSV_ROW_FORMAT % row)
+    
     def write_json(self, overwrite: bool = True) -> Path:
         """
         Write all readings to JSON file
@@ -130,16 +211,21 @@ class TPMSLogger:
             return self.json_file
         
         try:
-            data = {
-                'session': self.session_name,
-                'created': datetime.now().isoformat(),
-                'reading_count': len(self.readings),
-                'readings': [reading.to_dict() for reading in self.readings],
-                'summary': self._generate_summary()
-            }
-            
-            with open(self.json_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Stream the readings array one object per line rather than
+            # building the whole document in memory and pretty-printing it
+            with open(self.json_file, 'wb', buffering=LOG_BUFFER_SIZE) as f:
+                f.write(b'{"session": ' + _json_bytes(self.session_name) + b',\n')
+                f.write(b'"created": ' + _json_bytes(datetime.now().isoformat()) + b',\n')
+                f.write(b'"reading_count": %d,\n' % len(self.readings))
+                f.write(b'"readings": [')
+                sep = b'\n'
+                for r in self.readings:
+                    f.write(sep)
+                    f.write(_json_bytes(r.to_dict()))
+                    sep = b',\n'
+                f.write(b'\n],\n"summary": ')
+                f.write(_json_bytes(self._generate_summary(), indent=True))
+                f.write(b'}\n')
             
             logger.info(f"JSON log written: {self.json_file}")
             return self.json_file
@@ -153,34 +239,77 @@ class TPMSLogger:
         if not self.readings:
             return {}
         
+        sensors = set()
+        protocols = set()
+        suppliers = set()
+        low_battery = low_pressure = high_pressure = 0
+        rssi_sum = rssi_n = 0
+        p_sum = 0.0
+        p_n = 0
+        p_min = p_max = None
+        t_sum = 0.0
+        t_n = 0
+        t_min = t_max = None
+        
+        # Single pass over the session; every statistic shares this scan
+        for r in self.readings:
+            sensors.add(r.sensor_id)
+            protocols.add(r.protocol)
+            if r.supplier:
+                suppliers.add(r.supplier)
+            if r.battery_low:
+                low_battery += 1
+            status = r.get_pressure_status()
+            if status == 'LOW' or status == 'CRITICAL':
+                low_pressure += 1
+            elif status == 'HIGH':
+                high_pressure += 1
+            rssi = r.signal_strength
+            if rssi is not None:
+                rssi_sum += rssi
+                rssi_n += 1
+            psi = r.pressure_psi
+            if psi is not None:
+                p_sum += psi
+                p_n += 1
+                if p_min is None or psi < p_min:
+                    p_min = psi
+                if p_max is None or psi > p_max:
+                    p_max = psi
+            temp = r.temperature_c
+            if temp is not None:
+                t_sum += temp
+                t_n += 1
+                if t_min is None or temp < t_min:
+                    t_min = temp
+                if t_max is None or temp > t_max:
+                    t_max = temp
+        
         summary = {
             'total_readings': len(self.readings),
-            'unique_sensors': len(set(r.sensor_id for r in self.readings)),
-            'protocols_detected': list(set(r.protocol for r in self.readings)),
-            'suppliers_detected': list(set(r.supplier for r in self.readings if r.supplier)),
-            'low_battery_count': sum(1 for r in self.readings if r.battery_low),
-            'low_pressure_count': sum(1 for r in self.readings if r.get_pressure_status() in ['LOW', 'CRITICAL']),
-            'high_pressure_count': sum(1 for r in self.readings if r.get_pressure_status() == 'HIGH'),
-            'avg_rssi': round(sum(r.signal_strength for r in self.readings if r.signal_strength) / 
-                            sum(1 for r in self.readings if r.signal_strength), 1) if any(r.signal_strength for r in self.readings) else None,
+            'unique_sensors': len(sensors),
+            'protocols_detected': list(protocols),
+            'suppliers_detected': list(suppliers),
+            'low_battery_count': low_battery,
+            'low_pressure_count': low_pressure,
+            'high_pressure_count': high_pressure,
+            'avg_rssi': round(rssi_sum / rssi_n, 1) if rssi_n else None,
         }
         
         # Pressure statistics
-        pressures = [r.pressure_psi for r in self.readings if r.pressure_psi]
-        if pressures:
+        if p_n:
             summary['pressure_stats'] = {
-                'min_psi': min(pressures),
-                'max_psi': max(pressures),
-                'avg_psi': round(sum(pressures) / len(pressures), 2)
+                'min_psi': p_min,
+                'max_psi': p_max,
+                'avg_psi': round(p_sum / p_n, 2)
             }
         
         # Temperature statistics
-        temps = [r.temperature_c for r in self.readings if r.temperature_c is not None]
-        if temps:
+        if t_n:
             summary['temperature_stats'] = {
-                'min_c': min(temps),
-                'max_c': max(temps),
-                'avg_c': round(sum(temps) / len(temps), 1)
+                'min_c': t_min,
+                'max_c': t_max,
+                'avg_c': round(t_sum / t_n, 1)
             }
         
         return summary
@@ -197,7 +326,7 @@ class TPMSLogger:
         return {
             'session_name': self.session_name,
             'reading_count': len(self.readings),
-            'unique_sensors': len(set(r.sensor_id for r in self.readings)),
+            'unique_sensors': len({r.sensor_id for r in self.readings}),
             'csv_file': str(self.csv_file),
             'json_file': str(self.json_file),
             'log_dir': str(self.log_dir)
@@ -229,55 +358,81 @@ def analyze_log_file(filepath: str) -> Dict:
 
 def _analyze_csv(filepath: Path) -> Dict:
     """Analyze CSV log file"""
-    readings = []
+    total = 0
+    sensor_ids = set()
+    protocols = set()
+    p_sum = 0.0
+    p_n = 0
+    p_min = p_max = None
+    t_sum = 0.0
+    t_n = 0
+    t_min = t_max = None
+    rssi_sum = 0
+    rssi_n = 0
     
     try:
-        with open(filepath, 'r') as f:
-            reader = csv.DictReader(f)
+        # Stream the rows; only running aggregates are kept in memory
+        with open(filepath, 'r', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            # Resolve column positions once; absent columns read as ''
+            columns = ('sensor_id', 'protocol', 'pressure_psi', 'temperature_c', 'rssi')
+            idx = [header.index(name) if name in header else len(header) for name in columns]
+            width = max(idx) + 1
+            i_sid, i_proto, i_p, i_t, i_r = idx
+            
             for row in reader:
-                readings.append(row)
+                if not row:
+                    continue
+                if len(row) < width:
+                    row += [''] * (width - len(row))
+                total += 1
+                sensor_ids.add(row[i_sid])
+                protocols.add(row[i_proto])
+                
+                try:
+                    if row[i_p]:
+                        psi = float(row[i_p])
+                        p_sum += psi
+                        p_n += 1
+                        if p_min is None or psi < p_min:
+                            p_min = psi
+                        if p_max is None or psi > p_max:
+                            p_max = psi
+                    if row[i_t]:
+                        temp = float(row[i_t])
+                        t_sum += temp
+                        t_n += 1
+                        if t_min is None or temp < t_min:
+                            t_min = temp
+                        if t_max is None or temp > t_max:
+                            t_max = temp
+                    if row[i_r]:
+                        rssi_sum += int(row[i_r])
+                        rssi_n += 1
+                except ValueError:
+                    continue
         
-        if not readings:
+        if not total:
             return {'error': 'No data in CSV file'}
         
-        # Parse numeric values
-        pressures = []
-        temps = []
-        rssis = []
-        sensor_ids = set()
-        protocols = set()
-        
-        for row in readings:
-            sensor_ids.add(row.get('sensor_id', ''))
-            protocols.add(row.get('protocol', ''))
-            
-            try:
-                if row.get('pressure_psi'):
-                    pressures.append(float(row['pressure_psi']))
-                if row.get('temperature_c'):
-                    temps.append(float(row['temperature_c']))
-                if row.get('rssi'):
-                    rssis.append(int(row['rssi']))
-            except ValueError:
-                continue
-        
         return {
             'file': str(filepath),
-            'total_readings': len(readings),
+            'total_readings': total,
             'unique_sensors': len(sensor_ids),
             'protocols': list(protocols),
             'pressure_stats': {
-                'min': min(pressures) if pressures else None,
-                'max': max(pressures) if pressures else None,
-                'avg': round(sum(pressures) / len(pressures), 2) if pressures else None
+                'min': p_min,
+                'max': p_max,
+                'avg': round(p_sum / p_n, 2) if p_n else None
             },
             'temperature_stats': {
-                'min': min(temps) if temps else None,
-                'max': max(temps) if temps else None,
-                'avg': round(sum(temps) / len(temps), 1) if temps else None
+                'min': t_min,
+                'max': t_max,
+                'avg': round(t_sum / t_n, 1) if t_n else None
             },
             'signal_stats': {
-                'avg_rssi': round(sum(rssis) / len(rssis), 1) if rssis else None
+                'avg_rssi': round(rssi_sum / rssi_n, 1) if rssi_n else None
             }
         }
     
@@ -289,7 +444,7 @@ def _analyze_csv(filepath: Path) -> Dict:
 def _analyze_json(filepath: Path) -> Dict:
     """Analyze JSON log file"""
     try:
-        with open(filepath, 'r') as f:
+        with open(filepath, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
         # Return the summary if available
@@ -326,6 +481,7 @@ if __name__ == '__main__':
     
     logger.add_reading(sample)
     logger.export_all()
+    logger.close()
     
     print("✓ Test export complete")
     print(logger.get_summary())
@@ -7,6 +7,8 @@ Shows tire pressure, temperature, battery status, and signal quality
 for multiple sensors.
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import subprocess
@@ -14,8 +16,12 @@ import threading
 import queue
 import time
 import signal
-import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+import collections
+import multiprocessing
+import io
+import re
+import struct
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Optional
 import logging
@@ -26,24 +32,137 @@ from tpms_decoder import TPMSDecoder, TPMSReading
 
 logger = logging.getLogger(__name__)
 
+# tkinter is imported by _load_tkinter() when the first window is built, so
+# the spawned decoder process and other importers never load Tk
+tk = ttk = messagebox = scrolledtext = None
+
+
+def _load_tkinter():
+    """Import tkinter into the module globals on first use"""
+    global tk, ttk, messagebox, scrolledtext
+    if tk is None:
+        import tkinter
+        from tkinter import ttk as _ttk, messagebox as _messagebox, scrolledtext as _scrolledtext
+        tk, ttk, messagebox, scrolledtext = tkinter, _ttk, _messagebox, _scrolledtext
+
+
+# Decoded packets are coalesced and pushed to the widgets on this tick
+UI_TICK_MS = 100
+LOG_MAX_LINES = 2000  # activity log keeps only the most recent lines
+RX_PIPE_BUFFER = 65536
+DECODE_BATCH = 256          # most packets handed back per decoder message
+DECODER_STOP_TIMEOUT = 1.0
+QUEUE_SWITCH_GRACE = 0.3    # > decoded_queue.get timeout in _process_packets
+
+# rx_profile_demo packet line:
+#   timestamp MODE=0x07 LEN=10 RSSI=-50 LQI=100 HEX=... DECODE=... fields
+_RX_LINE_RE = re.compile(r'\bRSSI=(-?\d+) LQI=(\d+) HEX=([0-9A-Fa-f]+)')
+
+# TPMS_RX_BINARY=1 runs rx_profile_demo with -B: each packet arrives as a
+# binary record (uint8 len, int8 rssi, uint8 lqi, len data bytes) on stdout
+RX_BINARY = os.getenv("TPMS_RX_BINARY", "0") == "1"
+_RX_RECORD_HEADER = struct.Struct('BbB')
+
+# Card background by pressure status
+_CARD_COLORS = {
+    "CRITICAL": "#3d0000",  # Dark red
+    "LOW": "#3d2200",       # Dark orange
+    "NORMAL": "#003d00",    # Dark green
+    "HIGH": "#3d3d00",      # Dark yellow
+    "UNKNOWN": "#1e1e1e"    # Dark gray
+}
+
+
+@dataclass(slots=True)
+class _SensorCard:
+    """Widgets of one sensor card that change between readings"""
+    frame: tk.Frame
+    layout: tuple
+    supplier: Optional[tk.Label] = None
+    protocol: Optional[tk.Label] = None
+    pressure_title: Optional[tk.Label] = None
+    pressure: Optional[tk.Label] = None
+    pressure_kpa: Optional[tk.Label] = None
+    temp: Optional[tk.Label] = None
+    temp_f: Optional[tk.Label] = None
+    battery: Optional[tk.Label] = None
+    battery_status: Optional[tk.Label] = None
+    rssi: Optional[tk.Label] = None
+    signal_quality: Optional[tk.Label] = None
+    timestamp: Optional[tk.Label] = None
+    transmission: Optional[tk.Label] = None
+    # Last options applied to each label, keyed by id(label)
+    shown: Dict[int, dict] = field(default_factory=dict)
+    
+    def set(self, label: tk.Label, **options):
+        """Configure a label only when its options differ from what is shown"""
+        if self.shown.get(id(label)) != options:
+            self.shown[id(label)] = options
+            label.config(**options)
+
+
+def _decode_worker(packet_queue, decoded_queue):
+    """Decoder process: decode raw packets in batches until a None sentinel arrives"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the GUI process handles Ctrl+C
+    decoder = TPMSDecoder()
+    while True:
+        item = packet_queue.get()
+        batch = []
+        while item is not None:
+            raw_bytes, rssi, lqi = item
+            try:
+                reading = decoder.decode_packet(raw_bytes, rssi, lqi)
+            except Exception as e:
+                logger.error(f"Packet decoding error: {e}")
+                reading = None
+            batch.append((raw_bytes, reading))
+            if len(batch) >= DECODE_BATCH:
+                break
+            try:
+                item = packet_queue.get_nowait()
+            except queue.Empty:
+                break
+        if batch:
+            decoded_queue.put(batch)
+        if item is None:
+            return
+
 
 class TPMSMonitorGUI:
     """GUI for monitoring TPMS sensors in real-time"""
     
     def __init__(self, root: tk.Tk, standalone: bool = True):
+        _load_tkinter()
         self.root = root
         self.standalone = standalone
-        self.decoder = TPMSDecoder()
         self.sensors: Dict[str, TPMSReading] = {}  # sensor_id -> latest reading
-        self.packet_queue = queue.Queue()
+        
+        # Raw packets go to a decoder process so decoding never holds the
+        # GIL against Tk; decoded batches come back on decoded_queue
+        self._mp = multiprocessing.get_context('spawn')
+        self.packet_queue = self._mp.Queue()
+        self.decoded_queue = self._mp.Queue()
+        self._decoder_process = None
+        # Decoder told to stop but not yet exited: (process, deadline)
+        self._stopping_decoder = None
         self.is_monitoring = False
         self.rx_process: Optional[subprocess.Popen] = None
         
+        # Filled by the processor thread, drained by _tick on the Tk thread
+        self._log_lines = collections.deque(maxlen=LOG_MAX_LINES)
+        self._dirty = False
+        self.packet_count = 0
+        self.warning_count = 0
+        self._stats_text = None
+        self._cards: Dict[str, _SensorCard] = {}
+        self._waiting_label: Optional[tk.Label] = None
+        
         if standalone:
             self.root.title("TPMS Monitor - RF Capture")
             self.root.geometry("900x700")
         
         self._setup_ui()
+        self.root.after(UI_TICK_MS, self._tick)
         
         # Start packet processor thread
         self.processor_thread = threading.Thread(target=self._process_packets, daemon=True)
@@ -121,12 +240,12 @@ class TPMSMonitorGUI:
         
         canvas = tk.Canvas(sensor_container, bg='#1e1e1e', highlightthickness=0)
         scrollbar = ttk.Scrollbar(sensor_container, orient='vertical', command=canvas.yview)
+        self.sensor_canvas = canvas
         self.sensor_frame = tk.Frame(canvas, bg='#1e1e1e')
         
-        self.sensor_frame.bind(
-            '<Configure>',
-            lambda e: canvas.configure(scrollregion=canvas.bbox('all'))
-        )
+        self._sensor_frame_size = None
+        self._scrollregion_pending = False
+        self.sensor_frame.bind('<Configure>', self._on_sensor_frame_configure)
         
         canvas.create_window((0, 0), window=self.sensor_frame, anchor='nw')
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -150,7 +269,8 @@ class TPMSMonitorGUI:
             font=('Courier', 9),
             bg='#0a0a0a',
             fg='#00ff00',
-            wrap='word'
+            wrap='word',
+            state='disabled'
         )
         self.log_text.pack(fill='both', expand=True, padx=5, pady=5)
         
@@ -168,13 +288,37 @@ class TPMSMonitorGUI:
             )
             close_btn.pack(pady=5)
     
+    def _on_sensor_frame_configure(self, event):
+        """Schedule one scrollregion update per burst of sensor frame resizes"""
+        size = (event.width, event.height)
+        if size == self._sensor_frame_size:
+            return
+        self._sensor_frame_size = size
+        if not self._scrollregion_pending:
+            self._scrollregion_pending = True
+            self.root.after_idle(self._update_scrollregion)
+    
+    def _update_scrollregion(self):
+        """Fit the canvas scrollregion to the sensor cards"""
+        self._scrollregion_pending = False
+        self.sensor_canvas.configure(scrollregion=self.sensor_canvas.bbox('all'))
+    
     def log(self, message: str, level: str = "INFO"):
         """Add message to activity log"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert('end', f"[{timestamp}] {level}: {message}\n")
-        self.log_text.see('end')
+        self._append_log_text(f"[{timestamp}] {level}: {message}\n")
         logger.info(message)
     
+    def _append_log_text(self, text: str):
+        """Append to the activity log widget, dropping lines beyond LOG_MAX_LINES"""
+        self.log_text.config(state='normal')
+        self.log_text.insert('end', text)
+        excess = int(self.log_text.index('end-1c').split('.')[0]) - 1 - LOG_MAX_LINES
+        if excess > 0:
+            self.log_text.delete('1.0', f'{excess + 1}.0')
+        self.log_text.config(state='disabled')
+        self.log_text.see('end')
+    
     def start_capture(self):
         """Start RF capture with rx_profile_demo"""
         if self.is_monitoring:
@@ -195,14 +339,18 @@ class TPMSMonitorGUI:
         self.log("Starting TPMS capture (433.92 MHz, mode TPMS)...", "INFO")
         
         try:
+            self._start_decoder()
+            
             # Start rx_profile_demo in TPMS mode (non-interactive sudo)
+            # In binary mode stdout carries only packet records; the tool's
+            # text output goes to our stderr instead of being parsed
+            rx_args = ['sudo', '-n', rx_binary, '-mTPMS'] + (['-B'] if RX_BINARY else [])
             self.rx_process = subprocess.Popen(
-                ['sudo', '-n', rx_binary, '-mTPMS'],
+                rx_args,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
+                stderr=None if RX_BINARY else subprocess.STDOUT,
                 stdin=subprocess.DEVNULL,
-                universal_newlines=True,
-                bufsize=1,
+                bufsize=RX_PIPE_BUFFER,
                 preexec_fn=os.setsid  # own process group for clean kill
             )
 
@@ -245,6 +393,8 @@ class TPMSMonitorGUI:
                 self.log(f"Error stopping capture: {e}", "ERROR")
             self.rx_process = None
         
+        self._stop_decoder()
+        
         self.start_btn.config(state='normal')
         self.stop_btn.config(state='disabled')
         self.status_label.config(text="⏸️ Stopped", fg='#999999')
@@ -256,18 +406,19 @@ class TPMSMonitorGUI:
             return
         
         try:
-            for line in iter(self.rx_process.stdout.readline, ''):
+            if RX_BINARY:
+                self._read_rx_records()
+                return
+            
+            # Binary pipe with a large buffer; decode through one text wrapper
+            rx_lines = io.TextIOWrapper(self.rx_process.stdout, encoding='ascii',
+                                        errors='replace', newline='\n')
+            for line in rx_lines:
                 if not self.is_monitoring:
                     break
                 
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Parse rx_profile_demo output
-                # Format: timestamp MODE=0x07 LEN=10 RSSI=-50 LQI=100 HEX=... DECODE=... fields
-                if 'HEX=' in line and 'RSSI=' in line:
-                    self._parse_rx_line(line)
+                # Lines without a packet are skipped by _RX_LINE_RE
+                self._parse_rx_line(line)
         except Exception as e:
             logger.error(f"RX reader error: {e}")
         finally:
@@ -275,6 +426,27 @@ class TPMSMonitorGUI:
             # Ensure UI reflects stopped state
             self.root.after(0, self._on_capture_stopped)
 
+    def _read_rx_records(self):
+        """Read binary packet records (rx_profile_demo -B) straight off the pipe"""
+        fd = self.rx_process.stdout.fileno()
+        header_size = _RX_RECORD_HEADER.size
+        unpack_header = _RX_RECORD_HEADER.unpack_from
+        buf = bytearray()
+        while self.is_monitoring:
+            chunk = os.read(fd, RX_PIPE_BUFFER)
+            if not chunk:
+                break
+            buf += chunk
+            pos = 0
+            while len(buf) - pos >= header_size:
+                length, rssi, lqi = unpack_header(buf, pos)
+                end = pos + header_size + length
+                if end > len(buf):
+                    break
+                self.packet_queue.put((bytes(buf[pos + header_size:end]), rssi, lqi))
+                pos = end
+            del buf[:pos]
+    
     def _on_capture_stopped(self):
         """Update UI when capture stops (by user or error)"""
         self.start_btn.config(state='normal')
@@ -288,107 +460,198 @@ class TPMSMonitorGUI:
     
     def _parse_rx_line(self, line: str):
         """Parse a line from rx_profile_demo output"""
+        m = _RX_LINE_RE.search(line)
+        if m is None:
+            return
         try:
-            # Extract fields
-            parts = line.split()
-            hex_data = None
-            rssi = 0
-            lqi = 0
-            
-            for part in parts:
-                if part.startswith('HEX='):
-                    hex_data = part.split('=')[1]
-                elif part.startswith('RSSI='):
-                    rssi = int(part.split('=')[1])
-                elif part.startswith('LQI='):
-                    lqi = int(part.split('=')[1])
-            
-            if hex_data:
-                raw_bytes = bytes.fromhex(hex_data)
-                self.packet_queue.put((raw_bytes, rssi, lqi))
-        except Exception as e:
+            raw_bytes = bytes.fromhex(m.group(3))
+        except ValueError as e:
             logger.debug(f"Failed to parse RX line: {e}")
+            return
+        self.packet_queue.put((raw_bytes, int(m.group(1)), int(m.group(2))))
+    
+    def _queue_log(self, message: str, level: str = "INFO"):
+        """Queue a log line from a worker thread; written by the next _tick"""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self._log_lines.append(f"[{timestamp}] {level}: {message}\n")
+        logger.info(message)
+    
+    def _start_decoder(self):
+        """Start the decoder process unless one is already running"""
+        if self._decoder_process is not None and self._decoder_process.is_alive():
+            return
+        if self._stopping_decoder is not None:
+            # The previous decoder is still draining and may yet have to be
+            # terminated; give the new one queues of its own
+            self._replace_queues()
+        self._decoder_process = self._mp.Process(
+            target=_decode_worker,
+            args=(self.packet_queue, self.decoded_queue),
+            name='tpms-decoder',
+            daemon=True
+        )
+        self._decoder_process.start()
+    
+    def _stop_decoder(self):
+        """Ask the decoder to finish queued packets and exit; reaped from _reap_decoder"""
+        proc = self._decoder_process
+        if proc is None:
+            return
+        self._decoder_process = None
+        self.packet_queue.put(None)
+        self._stopping_decoder = (proc, time.monotonic() + DECODER_STOP_TIMEOUT, self.decoded_queue)
+        self.root.after(UI_TICK_MS, self._reap_decoder)
+    
+    def _reap_decoder(self):
+        """Poll the stopping decoder from the Tk loop; terminate it if it overruns"""
+        if self._stopping_decoder is None:
+            return
+        proc, deadline, decoded_queue = self._stopping_decoder
+        if not proc.is_alive():
+            proc.join()
+            self._stopping_decoder = None
+            return
+        now = time.monotonic()
+        if now < deadline:
+            self.root.after(UI_TICK_MS, self._reap_decoder)
+            return
+        if self.decoded_queue is decoded_queue:
+            # A kill mid-put would leave a torn message on these queues: move
+            # the collector thread onto fresh ones before terminating
+            self._replace_queues()
+            self._stopping_decoder = (proc, now + QUEUE_SWITCH_GRACE, decoded_queue)
+            self.root.after(UI_TICK_MS, self._reap_decoder)
+            return
+        proc.terminate()
+        proc.join(timeout=0.1)
+        self._stopping_decoder = None
+    
+    def _replace_queues(self):
+        """Swap in fresh packet/decoded queues, abandoning the current pair"""
+        for q in (self.packet_queue, self.decoded_queue):
+            q.cancel_join_thread()  # don't block exit flushing into a dead pipe
+        self.packet_queue = self._mp.Queue()
+        self.decoded_queue = self._mp.Queue()
     
     def _process_packets(self):
-        """Process packets from queue and update GUI"""
-        packet_count = 0
-        
+        """Collect decoded packets; the GUI picks up results in _tick"""
         while True:
             try:
-                raw_bytes, rssi, lqi = self.packet_queue.get(timeout=0.1)
-                packet_count += 1
-                
-                # Decode packet
-                reading = self.decoder.decode_packet(raw_bytes, rssi, lqi)
-                
-                if reading and reading.sensor_id != "UNKNOWN":
-                    # Update or add sensor
-                    self.sensors[reading.sensor_id] = reading
-                    self.root.after(0, self._update_sensor_display)
-                    
-                    # Log with pressure status
-                    pressure_status = reading.get_pressure_status()
-                    status_icon = "⚠️" if pressure_status != "NORMAL" else "✓"
-                    self.root.after(0, lambda: self.log(
-                        f"{status_icon} Sensor {reading.sensor_id}: {reading.pressure_psi:.1f} PSI ({pressure_status}), "
-                        f"{reading.temperature_c:.1f}°C [{reading.protocol}]"
-                    ))
-                else:
-                    self.root.after(0, lambda: self.log(
-                        f"Unknown packet: {raw_bytes.hex()[:20]}...", "DEBUG"
-                    ))
-                
-                # Update stats with warning count
-                warning_count = sum(1 for r in self.sensors.values() if r.get_pressure_status() != "NORMAL")
-                self.root.after(0, lambda: self.stats_label.config(
-                    text=f"Packets: {packet_count} | Sensors: {len(self.sensors)} | Warnings: {warning_count}"
-                ))
-                
+                batch = self.decoded_queue.get(timeout=0.1)
             except queue.Empty:
                 continue
-            except Exception as e:
-                logger.error(f"Packet processing error: {e}")
+            
+            for raw_bytes, reading in batch:
+                self.packet_count += 1
+                try:
+                    if reading and reading.sensor_id != "UNKNOWN":
+                        # Update or add sensor
+                        self.sensors[reading.sensor_id] = reading
+                        self.warning_count = sum(1 for r in self.sensors.values() if r.get_pressure_status() != "NORMAL")
+                        self._dirty = True
+                        
+                        # Log with pressure status
+                        pressure_status = reading.get_pressure_status()
+                        status_icon = "⚠️" if pressure_status != "NORMAL" else "✓"
+                        self._queue_log(
+                            f"{status_icon} Sensor {reading.sensor_id}: {reading.pressure_psi:.1f} PSI ({pressure_status}), "
+                            f"{reading.temperature_c:.1f}°C [{reading.protocol}]"
+                        )
+                    else:
+                        self._queue_log(f"Unknown packet: {raw_bytes.hex()[:20]}...", "DEBUG")
+                except Exception as e:
+                    logger.error(f"Packet processing error: {e}")
+    
+    def _tick(self):
+        """Apply everything decoded since the last tick in one batch of widget updates"""
+        if self._log_lines:
+            lines = []
+            while self._log_lines:
+                lines.append(self._log_lines.popleft())
+            self._append_log_text(''.join(lines))
+        
+        stats = f"Packets: {self.packet_count} | Sensors: {len(self.sensors)} | Warnings: {self.warning_count}"
+        if stats != self._stats_text:
+            self._stats_text = stats
+            self.stats_label.config(text=stats)
+        
+        if self._dirty:
+            self._dirty = False
+            self._update_sensor_display()
+        
+        self.root.after(UI_TICK_MS, self._tick)
     
     def _update_sensor_display(self):
-        """Update sensor cards in GUI"""
-        # Clear existing cards
-        for widget in self.sensor_frame.winfo_children():
-            widget.destroy()
-        
-        if not self.sensors:
-            no_data = tk.Label(
-                self.sensor_frame,
-                text="⏳ Waiting for TPMS sensors...\n\nMake sure CC1101 is connected and configured for 433.92 MHz.",
-                font=('Arial', 12),
-                fg='#666666',
-                bg='#1e1e1e',
-                pady=50
-            )
-            no_data.pack()
+        """Update sensor cards in GUI, creating a card only for new sensors"""
+        readings = sorted(self.sensors.items())
+        
+        if not readings:
+            for card in self._cards.values():
+                card.frame.destroy()
+            self._cards.clear()
+            if self._waiting_label is None:
+                self._waiting_label = tk.Label(
+                    self.sensor_frame,
+                    text="⏳ Waiting for TPMS sensors...\n\nMake sure CC1101 is connected and configured for 433.92 MHz.",
+                    font=('Arial', 12),
+                    fg='#666666',
+                    bg='#1e1e1e',
+                    pady=50
+                )
+                self._waiting_label.pack()
             return
         
-        # Create card for each sensor
-        for sensor_id, reading in sorted(self.sensors.items()):
-            self._create_sensor_card(sensor_id, reading)
+        if self._waiting_label is not None:
+            self._waiting_label.destroy()
+            self._waiting_label = None
+        
+        # Drop cards for sensors that have gone away
+        for sensor_id in self._cards.keys() - self.sensors.keys():
+            self._cards.pop(sensor_id).frame.destroy()
+        
+        repack = False
+        for sensor_id, reading in readings:
+            card = self._cards.get(sensor_id)
+            layout = self._card_layout(reading)
+            if card is not None and card.layout != layout:
+                # Sections or background changed: rebuild just this card
+                card.frame.destroy()
+                card = None
+            if card is None:
+                card = self._create_sensor_card(sensor_id, reading, layout)
+                self._cards[sensor_id] = card
+                repack = True
+            self._fill_sensor_card(card, reading)
+        
+        if repack:
+            # Keep cards in sensor_id order after an insertion
+            for _, card in sorted(self._cards.items()):
+                card.frame.pack_forget()
+                card.frame.pack(fill='x', padx=10, pady=5)
     
-    def _create_sensor_card(self, sensor_id: str, reading: TPMSReading):
-        """Create a display card for one sensor with enhanced visuals"""
-        # Determine card color based on pressure status
-        pressure_status = reading.get_pressure_status()
-        status_color_map = {
-            "CRITICAL": "#3d0000",  # Dark red
-            "LOW": "#3d2200",       # Dark orange
-            "NORMAL": "#003d00",    # Dark green
-            "HIGH": "#3d3d00",      # Dark yellow
-            "UNKNOWN": "#1e1e1e"    # Dark gray
-        }
-        card_bg = status_color_map.get(pressure_status, "#2d2d2d")
-        
-        card = tk.Frame(self.sensor_frame, bg=card_bg, relief='raised', bd=2)
-        card.pack(fill='x', padx=10, pady=5)
+    @staticmethod
+    def _card_layout(reading: TPMSReading) -> tuple:
+        """Which sections a card has, plus its background; a change needs a rebuild"""
+        return (
+            _CARD_COLORS.get(reading.get_pressure_status(), "#2d2d2d"),
+            bool(reading.supplier),
+            bool(reading.pressure_psi),
+            reading.temperature_c is not None,
+            reading.battery_low is not None,
+            bool(reading.signal_strength),
+            bool(reading.transmission_type),
+        )
+    
+    def _create_sensor_card(self, sensor_id: str, reading: TPMSReading, layout: tuple) -> '_SensorCard':
+        """Create the widgets for one sensor card; values are set by _fill_sensor_card"""
+        card_bg, has_supplier, has_pressure, has_temp, has_battery, has_signal, has_tx = layout
+        
+        frame = tk.Frame(self.sensor_frame, bg=card_bg, relief='raised', bd=2)
+        frame.pack(fill='x', padx=10, pady=5)
+        card = _SensorCard(frame=frame, layout=layout)
         
         # Header with supplier info
-        header = tk.Frame(card, bg='#1e5fa8')
+        header = tk.Frame(frame, bg='#1e5fa8')
         header.pack(fill='x')
         
         # Sensor ID and supplier
@@ -405,64 +668,44 @@ class TPMSMonitorGUI:
             pady=5
         ).pack(side='left')
         
-        if reading.supplier:
-            tk.Label(
+        if has_supplier:
+            card.supplier = tk.Label(
                 header_left,
-                text=f"({reading.supplier})",
                 font=('Arial', 9),
                 fg='#cccccc',
                 bg='#1e5fa8',
                 padx=5
-            ).pack(side='left')
+            )
+            card.supplier.pack(side='left')
         
         # Protocol badge
-        tk.Label(
+        card.protocol = tk.Label(
             header,
-            text=f"{reading.protocol}",
             font=('Arial', 9),
             fg='#00ff88',
             bg='#1e5fa8',
             padx=10
-        ).pack(side='right')
+        )
+        card.protocol.pack(side='right')
         
         # Data grid with improved layout
-        data_frame = tk.Frame(card, bg=card_bg)
+        data_frame = tk.Frame(frame, bg=card_bg)
         data_frame.pack(fill='both', expand=True, padx=15, pady=10)
         
         # Pressure with status indicator
-        if reading.pressure_psi:
+        if has_pressure:
             pressure_frame = tk.Frame(data_frame, bg=card_bg)
             pressure_frame.pack(side='left', padx=15, pady=5)
             
-            pressure_color = reading.get_pressure_color()
-            status_indicator = f"●"  # Filled circle indicator
-            
-            tk.Label(
-                pressure_frame,
-                text=f"{status_indicator} PRESSURE ({pressure_status})",
-                font=('Arial', 8),
-                fg=pressure_color,
-                bg=card_bg
-            ).pack()
-            
-            tk.Label(
-                pressure_frame,
-                text=f"{reading.pressure_psi:.1f} PSI",
-                font=('Arial', 18, 'bold'),
-                fg=pressure_color,
-                bg=card_bg
-            ).pack()
-            
-            tk.Label(
-                pressure_frame,
-                text=f"({reading.pressure_kpa:.0f} kPa)",
-                font=('Arial', 9),
-                fg='#888888',
-                bg=card_bg
-            ).pack()
+            card.pressure_title = tk.Label(pressure_frame, font=('Arial', 8), bg=card_bg)
+            card.pressure_title.pack()
+            card.pressure = tk.Label(pressure_frame, font=('Arial', 18, 'bold'), bg=card_bg)
+            card.pressure.pack()
+            card.pressure_kpa = tk.Label(pressure_frame, font=('Arial', 9), fg='#888888', bg=card_bg)
+            card.pressure_kpa.pack()
         
         # Temperature with icon
-        if reading.temperature_c is not None:
+        if has_temp:
             temp_frame = tk.Frame(data_frame, bg=card_bg)
             temp_frame.pack(side='left', padx=15, pady=5)
             
@@ -473,29 +716,79 @@ class TPMSMonitorGUI:
                 fg='#888888',
                 bg=card_bg
             ).pack()
+            card.temp = tk.Label(temp_frame, font=('Arial', 16, 'bold'), fg='#ff6b6b', bg=card_bg)
+            card.temp.pack()
+            card.temp_f = tk.Label(temp_frame, font=('Arial', 8), fg='#888888', bg=card_bg)
+            card.temp_f.pack()
+        
+        # Battery status with large indicator
+        if has_battery:
+            battery_frame = tk.Frame(data_frame, bg=card_bg)
+            battery_frame.pack(side='left', padx=15, pady=5)
             
-            temp_f = reading.temperature_c * 9/5 + 32
             tk.Label(
-                temp_frame,
-                text=f"{reading.temperature_c:.1f}°C",
-                font=('Arial', 16, 'bold'),
-                fg='#ff6b6b',
+                battery_frame,
+                text="🔋 BATTERY",
+                font=('Arial', 8),
+                fg='#888888',
                 bg=card_bg
             ).pack()
+            card.battery = tk.Label(battery_frame, font=('Arial', 14, 'bold'), bg=card_bg)
+            card.battery.pack()
+            card.battery_status = tk.Label(battery_frame, font=('Arial', 8), bg=card_bg)
+            card.battery_status.pack()
+        
+        # Signal quality (RSSI/LQI)
+        if has_signal:
+            signal_frame = tk.Frame(data_frame, bg=card_bg)
+            signal_frame.pack(side='left', padx=15, pady=5)
             
             tk.Label(
-                temp_frame,
-                text=f"({temp_f:.1f}°F)",
+                signal_frame,
+                text="📶 SIGNAL",
                 font=('Arial', 8),
                 fg='#888888',
                 bg=card_bg
             ).pack()
+            card.rssi = tk.Label(signal_frame, font=('Arial', 12, 'bold'), bg=card_bg)
+            card.rssi.pack()
+            card.signal_quality = tk.Label(signal_frame, font=('Arial', 8), bg=card_bg)
+            card.signal_quality.pack()
         
-        # Battery status with large indicator
-        if reading.battery_low is not None:
-            battery_frame = tk.Frame(data_frame, bg=card_bg)
-            battery_frame.pack(side='left', padx=15, pady=5)
-            
+        # Timestamp at bottom
+        footer = tk.Frame(frame, bg=card_bg)
+        footer.pack(fill='x', padx=15, pady=(5, 10))
+        
+        card.timestamp = tk.Label(footer, font=('Arial', 7), fg='#555555', bg=card_bg)
+        card.timestamp.pack(side='left')
+        
+        if has_tx:
+            card.transmission = tk.Label(footer, font=('Arial', 7), fg='#555555', bg=card_bg)
+            card.transmission.pack(side='right')
+        
+        return card
+    
+    def _fill_sensor_card(self, card: '_SensorCard', reading: TPMSReading):
+        """Push a reading's values into an existing card, touching only changed labels"""
+        set_label = card.set
+        
+        if card.supplier is not None:
+            set_label(card.supplier, text=f"({reading.supplier})")
+        set_label(card.protocol, text=f"{reading.protocol}")
+        
+        if card.pressure is not None:
+            pressure_status = reading.get_pressure_status()
+            pressure_color = reading.get_pressure_color()
+            set_label(card.pressure_title, text=f"● PRESSURE ({pressure_status})", fg=pressure_color)
+            set_label(card.pressure, text=f"{reading.pressure_psi:.1f} PSI", fg=pressure_color)
+            set_label(card.pressure_kpa, text=f"({reading.pressure_kpa:.0f} kPa)")
+        
+        if card.temp is not None:
+            temp_f = reading.temperature_c * 9/5 + 32
+            set_label(card.temp, text=f"{reading.temperature_c:.1f}°C")
+            set_label(card.temp_f, text=f"({temp_f:.1f}°F)")
+        
+        if card.battery is not None:
             if reading.battery_low:
                 battery_color = '#ff0000'
                 battery_text = '🔴 LOW'
@@ -504,36 +797,10 @@ class TPMSMonitorGUI:
                 battery_color = '#00ff00'
                 battery_text = '🟢 OK'
                 battery_status = 'Good'
-            
-            tk.Label(
-                battery_frame,
-                text="🔋 BATTERY",
-                font=('Arial', 8),
-                fg='#888888',
-                bg=card_bg
-            ).pack()
-            
-            tk.Label(
-                battery_frame,
-                text=battery_text,
-                font=('Arial', 14, 'bold'),
-                fg=battery_color,
-                bg=card_bg
-            ).pack()
-            
-            tk.Label(
-                battery_frame,
-                text=battery_status,
-                font=('Arial', 8),
-                fg=battery_color,
-                bg=card_bg
-            ).pack()
+            set_label(card.battery, text=battery_text, fg=battery_color)
+            set_label(card.battery_status, text=battery_status, fg=battery_color)
         
-        # Signal quality (RSSI/LQI)
-        if reading.signal_strength:
-            signal_frame = tk.Frame(data_frame, bg=card_bg)
-            signal_frame.pack(side='left', padx=15, pady=5)
-            
+        if card.rssi is not None:
             # Determine signal strength indicator
             rssi = reading.signal_strength
             if rssi > -70:
@@ -548,55 +815,17 @@ class TPMSMonitorGUI:
             else:
                 signal_quality = "Poor"
                 signal_color = "#ff9900"
-            
-            tk.Label(
-                signal_frame,
-                text="📶 SIGNAL",
-                font=('Arial', 8),
-                fg='#888888',
-                bg=card_bg
-            ).pack()
-            
-            tk.Label(
-                signal_frame,
-                text=f"{rssi} dBm",
-                font=('Arial', 12, 'bold'),
-                fg=signal_color,
-                bg=card_bg
-            ).pack()
-            
-            tk.Label(
-                signal_frame,
-                text=signal_quality,
-                font=('Arial', 8),
-                fg=signal_color,
-                bg=card_bg
-            ).pack()
-        
-        # Timestamp at bottom
-        footer = tk.Frame(card, bg=card_bg)
-        footer.pack(fill='x', padx=15, pady=(5, 10))
+            set_label(card.rssi, text=f"{rssi} dBm", fg=signal_color)
+            set_label(card.signal_quality, text=signal_quality, fg=signal_color)
         
-        tk.Label(
-            footer,
-            text=f"⏱️ Last: {reading.timestamp}",
-            font=('Arial', 7),
-            fg='#555555',
-            bg=card_bg
-        ).pack(side='left')
-        
-        if reading.transmission_type:
-            tk.Label(
-                footer,
-                text=f"📡 {reading.transmission_type}",
-                font=('Arial', 7),
-                fg='#555555',
-                bg=card_bg
-            ).pack(side='right')
+        set_label(card.timestamp, text=f"⏱️ Last: {reading.timestamp}")
+        if card.transmission is not None:
+            set_label(card.transmission, text=f"📡 {reading.transmission_type}")
     
     def close_window(self):
         """Close the window"""
         self.stop_capture()
+        self._stop_decoder()
         if self.standalone:
             self.root.destroy()
         else:
@@ -610,6 +839,7 @@ def main():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
+    _load_tkinter()
     root = tk.Tk()
     app = TPMSMonitorGUI(root, standalone=True)
     
@@ -14,7 +14,7 @@ Example:
 """
 
 __version__ = "0.5.0"
-__all__ = ["BME690Sensor", "BME690MCPTools"]
+__all__ = ["BME690Sensor", "get_sensor", "BME690MCPTools"]
 
-from .bme690 import BME690Sensor
+from .bme690 import BME690Sensor, get_sensor
 from .bme690_mcp import BME690MCPTools
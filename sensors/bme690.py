@@ -21,9 +21,10 @@ Humidity Calibration:
 """
 
 import os
+import re
 import time
 import logging
-import configparser
+import threading
 from typing import Optional, Tuple, Dict, Any
 from pathlib import Path
 
@@ -36,6 +37,69 @@ CONFIG_PATHS = [
     os.path.expanduser("~/.config/rpi-lab/sensor.conf"),
 ]
 
+# sensor.conf is plain "key = value" INI; these cover it without ConfigParser
+_SECTION_RE = re.compile(rb'^\[([^\]]+)\][ \t]*\r?$', re.M)
+_OPTION_RE = re.compile(rb'^([A-Za-z_]\w*)[ \t]*=[ \t]*(.*?)[ \t]*\r?$', re.M)
+_CONTENT_RE = re.compile(rb'^[ \t]*[^#;\s]', re.M)
+_BOOLEAN_STATES = {
+    '1': True, 'yes': True, 'true': True, 'on': True,
+    '0': False, 'no': False, 'false': False, 'off': False,
+}
+
+
+def _read_bme690_options(config_path: str) -> Optional[Dict[str, str]]:
+    """Return the raw [BME690] options of a config file, or None if it has none.
+    
+    Simple files are scanned with two regexes. Anything the scan cannot vouch
+    for (continuation lines, ':' delimiters, interpolation, [DEFAULT],
+    duplicates) is left to ConfigParser, which also raises on malformed files.
+    """
+    with open(config_path, 'rb') as f:
+        data = f.read()
+    
+    headers = list(_SECTION_RE.finditer(data))
+    names = [m.group(1) for m in headers]
+    if b'DEFAULT' not in names and len(set(names)) == len(names):
+        options = None
+        simple = not _CONTENT_RE.search(data, 0, headers[0].start() if headers else len(data))
+        for i, header in enumerate(headers):
+            if not simple:
+                break
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(data)
+            body = data[header.end():end]
+            pairs = _OPTION_RE.findall(body)
+            section = {key.decode().lower(): value.decode() for key, value in pairs}
+            simple = len(pairs) == len(_CONTENT_RE.findall(body)) == len(section)
+            if header.group(1) == b'BME690':
+                options = section
+                # '%' would need ConfigParser's interpolation
+                simple = simple and not any('%' in value for value in section.values())
+        if simple:
+            return options
+    
+    import configparser  # only needed for files the scan above can't handle
+    parser = configparser.ConfigParser()
+    parser.read(config_path)
+    if 'BME690' not in parser:
+        return None
+    return dict(parser['BME690'])
+
+
+def _get_bool(options: Dict[str, str], key: str, default: bool) -> bool:
+    """ConfigParser.getboolean() equivalent for a raw options dict"""
+    if key not in options:
+        return default
+    value = options[key]
+    try:
+        return _BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}") from None
+
+
+# Parsed [BME690] values per config path, reused while (mtime_ns, size) match
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Optional[Dict[str, Any]]]] = {}
+
+
 def load_sensor_config() -> Dict[str, Any]:
     """Load sensor configuration from file or environment variables."""
     config = {
@@ -50,25 +114,39 @@ def load_sensor_config() -> Dict[str, Any]:
     # Try to load from config file
     config_loaded = False
     for config_path in CONFIG_PATHS:
-        if os.path.exists(config_path):
+        try:
+            st = os.stat(config_path)
+        except OSError:
+            continue
+        
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _CONFIG_CACHE.get(config_path)
+        if cached is not None and cached[0] == stamp:
+            values = cached[1]
+        else:
             try:
-                parser = configparser.ConfigParser()
-                parser.read(config_path)
+                options = _read_bme690_options(config_path)
                 
-                if 'BME690' in parser:
-                    bme_section = parser['BME690']
-                    config['dry_run'] = bme_section.getboolean('dry_run', False)
-                    config['enable_gas'] = bme_section.getboolean('enable_gas', True)
-                    config['humidity_scale'] = bme_section.getfloat('humidity_scale', 1.0)
-                    config['humidity_offset'] = bme_section.getfloat('humidity_offset', 0.0)
-                    config['temperature_offset'] = bme_section.getfloat('temperature_offset', 0.0)
-                    config['pressure_correction'] = bme_section.getfloat('pressure_correction', 4.33)
-                    
-                    logger.info(f"Loaded sensor config from {config_path}")
-                    config_loaded = True
-                    break
+                values = None
+                if options is not None:
+                    values = {
+                        'dry_run': _get_bool(options, 'dry_run', False),
+                        'enable_gas': _get_bool(options, 'enable_gas', True),
+                        'humidity_scale': float(options.get('humidity_scale', 1.0)),
+                        'humidity_offset': float(options.get('humidity_offset', 0.0)),
+                        'temperature_offset': float(options.get('temperature_offset', 0.0)),
+                        'pressure_correction': float(options.get('pressure_correction', 4.33)),
+                    }
             except Exception as e:
                 logger.warning(f"Failed to load config from {config_path}: {e}")
+                continue
+            _CONFIG_CACHE[config_path] = (stamp, values)
+        
+        if values is not None:
+            config.update(values)
+            logger.info(f"Loaded sensor config from {config_path}")
+            config_loaded = True
+            break
     
     # Fallback to environment variables
     if not config_loaded:
@@ -90,17 +168,45 @@ HUM_OFFSET = SENSOR_CONFIG['humidity_offset']
 TEMP_OFFSET = SENSOR_CONFIG['temperature_offset']
 PRESSURE_CORRECTION = SENSOR_CONFIG['pressure_correction']
 
-try:
-    import bme680
-    LIB_AVAILABLE = True
-except ImportError:
-    LIB_AVAILABLE = False
-    logger.warning("bme680 library not available. Sensor will use dry-run if enabled.")
+# The bme680 driver (and smbus2 under it) is imported by _load_lib() when
+# hardware is first opened, so dry-run and config-only importers skip it
+bme680 = None
+LIB_AVAILABLE: Optional[bool] = None  # unknown until _load_lib() runs
+
+# Forced-mode conversion time for the oversampling set in BME690Sensor
+# (hum 2x, press 4x, temp 8x = 14 cycles of ~1.963 ms plus ~6 ms of
+# fixed overhead), and the interval used to poll once it should be done
+MEASURE_MS = 14 * 1.963 + 6.3
+DATA_POLL_INTERVAL = 0.02
+
+# A successful read is reused for this long (seconds), so several
+# consumers polling together share one I2C measurement
+READ_CACHE_TTL = 0.5
+
+
+def _load_lib() -> bool:
+    """Import the bme680 library on first call and report whether it is available."""
+    global bme680, LIB_AVAILABLE
+    if LIB_AVAILABLE is None:
+        try:
+            import bme680 as lib
+        except ImportError:
+            LIB_AVAILABLE = False
+        else:
+            bme680 = lib
+            LIB_AVAILABLE = True
+    return LIB_AVAILABLE
 
 
 class BME690Sensor:
     """BME690 Environmental Sensor interface."""
 
+    __slots__ = (
+        'available', 'heat_stable', 'i2c_addr', 'sensor',
+        '_hum_cal', '_temp_cal', '_inv_pcorr', '_expected_s',
+        '_last', '_read_lock', '_last_fmt',
+    )
+
     def __init__(self, i2c_addr: Optional[int] = None):
         """
         Initialize BME690 sensor.
@@ -113,12 +219,26 @@ class BME690Sensor:
         self.heat_stable = False
         self.i2c_addr = i2c_addr
 
+        # Calibration constants are fixed for the process; resolve them once
+        # so read() skips no-op arithmetic and its debug checks
+        self._hum_cal = HUM_SCALE != 1.0 or HUM_OFFSET != 0.0
+        self._temp_cal = TEMP_OFFSET != 0.0
+        self._inv_pcorr = 1.0 / PRESSURE_CORRECTION
+        # Time a forced measurement needs before new data can be expected
+        self._expected_s = (MEASURE_MS + (150 if BME690_ENABLE_GAS else 0)) / 1000.0
+        # Last successful read as (monotonic time, values); the lock keeps
+        # concurrent callers from issuing parallel I2C transactions
+        self._last: Tuple[float, Optional[Tuple[float, float, float, float]]] = (0.0, None)
+        self._read_lock = threading.Lock()
+        # (values, heat_stable) and the formatted dict built from them
+        self._last_fmt: Tuple[Any, Optional[Dict[str, Any]]] = (None, None)
+
         if DRY_RUN:
             logger.info("BME690 dry-run mode enabled (no hardware required)")
             self.available = True
             return
 
-        if not LIB_AVAILABLE:
+        if not _load_lib():
             logger.error("bme680 library not installed (pip install bme680)")
             return
 
@@ -153,9 +273,9 @@ class BME690Sensor:
 
             self.available = True
             logger.info(f"BME690 initialized on I2C address 0x{self.i2c_addr:02X}")
-            if HUM_SCALE != 1.0 or HUM_OFFSET != 0.0:
+            if self._hum_cal:
                 logger.info(f"Humidity calibration: scale={HUM_SCALE}, offset={HUM_OFFSET}%RH")
-            if TEMP_OFFSET != 0.0:
+            if self._temp_cal:
                 logger.info(f"Temperature calibration: offset={TEMP_OFFSET}°C")
             if PRESSURE_CORRECTION != 4.33:
                 logger.info(f"Pressure correction: factor={PRESSURE_CORRECTION}")
@@ -167,11 +287,17 @@ class BME690Sensor:
         """
         Read humidity (%), temperature (°C), pressure (hPa), gas resistance (Ohms).
         
-        Implements exponential backoff retry for transient I2C errors.
+        A successful result is reused for READ_CACHE_TTL seconds; callers
+        arriving during a read wait for it instead of starting another.
+
+        When the sensor has no new data yet, waits once for the expected
+        conversion time and then polls every DATA_POLL_INTERVAL for up to
+        max_retries * retry_delay. Transient I2C errors are retried with
+        exponential backoff.
 
         Args:
-            max_retries: Maximum number of retry attempts (default: 3)
-            retry_delay: Initial delay between retries in seconds (default: 0.1s)
+            max_retries: Maximum number of attempts after I2C errors (default: 3)
+            retry_delay: Initial delay between error retries in seconds (default: 0.1s)
 
         Returns:
             Tuple (humidity, temperature, pressure, gas_resistance). Returns
@@ -188,77 +314,112 @@ class BME690Sensor:
             g = 10000.0
             return h, t, p, g
 
-        # Retry loop with exponential backoff for transient I2C errors
-        for attempt in range(max_retries):
+        with self._read_lock:
+            stamp, values = self._last
+            if values is not None and time.monotonic() - stamp < READ_CACHE_TTL:
+                return values
+            result = self._read_hardware(max_retries, retry_delay)
+            if result[0] is not None:
+                self._last = (time.monotonic(), result)
+            return result
+
+    def _read_hardware(self, max_retries: int, retry_delay: float) -> Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
+        """Run one measurement with polling and error retries (see read())."""
+        # Errors back off exponentially; "no data" polls on a short interval
+        attempt = 0
+        errors = 0
+        poll_deadline = None
+        while True:
+            attempt += 1
             try:
-                if self.sensor.get_sensor_data():
-                    self.heat_stable = bool(getattr(self.sensor.data, "heat_stable", False))
-                    raw_temperature = float(self.sensor.data.temperature)
-                    temperature = raw_temperature + TEMP_OFFSET
-                    
-                    # BUGFIX: bme680 library v2.0.0 with BME688 chip (BME690 breakout)
-                    # Pressure reads 4.33x too high - apply correction factor
-                    pressure_raw = float(self.sensor.data.pressure)
-                    pressure = pressure_raw / PRESSURE_CORRECTION
-                    
-                    raw_humidity = float(self.sensor.data.humidity)
-                    gas_resistance = float(getattr(self.sensor.data, "gas_resistance", 0.0))
-
-                    # Apply optional humidity calibration and clamp to 0..100
-                    humidity = max(0.0, min(100.0, raw_humidity * HUM_SCALE + HUM_OFFSET))
-                    
-                    # Log calibration application if active (debug level)
-                    if (HUM_SCALE != 1.0 or HUM_OFFSET != 0.0) and raw_humidity != humidity:
-                        logger.debug(f"Humidity calibrated: {raw_humidity:.1f}%RH → {humidity:.1f}%RH")
-                    if TEMP_OFFSET != 0.0:
-                        logger.debug(f"Temperature calibrated: {raw_temperature:.1f}°C → {temperature:.1f}°C")
-                    
-                    # Success - log if it took retries
-                    if attempt > 0:
-                        logger.info(f"BME690 read succeeded after {attempt + 1} attempts")
-                    
-                    return humidity, temperature, pressure, gas_resistance
-                else:
-                    # No data available, but no exception - might be sensor warming up
-                    if attempt < max_retries - 1:
-                        logger.debug(f"BME690 no data on attempt {attempt + 1}, retrying...")
-                        time.sleep(retry_delay * (2 ** attempt))
-                        continue
-                    else:
-                        logger.warning("BME690 no data after all retry attempts")
-                        return None, None, None, None
-                        
-            except (OSError, IOError) as e:
-                # I2C bus errors - these are often transient
-                if attempt < max_retries - 1:
-                    logger.debug(f"I2C error on attempt {attempt + 1}: {e}, retrying...")
-                    time.sleep(retry_delay * (2 ** attempt))
-                    continue
-                else:
-                    logger.error(f"I2C error reading BME690 after {max_retries} attempts: {e}")
-                    return None, None, None, None
-                    
+                result = self._read_once()
             except Exception as e:
-                # Unexpected errors - log and retry
-                if attempt < max_retries - 1:
-                    logger.debug(f"Error on attempt {attempt + 1}: {e}, retrying...")
-                    time.sleep(retry_delay * (2 ** attempt))
-                    continue
-                else:
-                    logger.error(f"Error reading BME690 after {max_retries} attempts: {e}")
+                # I2C bus errors (OSError) are usually transient; others are unexpected
+                kind = "I2C error" if isinstance(e, OSError) else "Error"
+                errors += 1
+                if errors >= max_retries:
+                    logger.error(f"{kind} reading BME690 after {max_retries} attempts: {e}")
                     return None, None, None, None
-        
-        # Should not reach here, but safety fallback
-        return None, None, None, None
-
-    def read_formatted(self) -> Dict[str, Any]:
+                logger.debug("%s on attempt %d: %s, retrying...", kind, attempt, e)
+                time.sleep(retry_delay * (1 << (errors - 1)))
+                continue
+
+            if result is not None:
+                # Success - log if it took retries
+                if attempt > 1:
+                    logger.info("BME690 read succeeded after %d attempts", attempt)
+                return result
+
+            # No data available, but no exception - conversion not finished yet
+            now = time.monotonic()
+            if poll_deadline is None:
+                poll_deadline = now + self._expected_s + max_retries * retry_delay
+                delay = self._expected_s
+            else:
+                delay = DATA_POLL_INTERVAL
+            if now + delay > poll_deadline:
+                logger.warning("BME690 no data after all retry attempts")
+                return None, None, None, None
+            logger.debug("BME690 no data on attempt %d, retrying...", attempt)
+            time.sleep(delay)
+
+    def _read_once(self) -> Optional[Tuple[float, float, float, float]]:
+        """Take one measurement; return calibrated values, or None if no new data."""
+        if not self.sensor.get_sensor_data():
+            return None
+
+        # Snapshot every field from the driver's data object up front
+        data = self.sensor.data
+        raw_temperature = float(data.temperature)
+        pressure_raw = float(data.pressure)
+        raw_humidity = float(data.humidity)
+        try:
+            gas_resistance = float(data.gas_resistance)
+            self.heat_stable = bool(data.heat_stable)
+        except AttributeError:
+            gas_resistance = float(getattr(data, "gas_resistance", 0.0))
+            self.heat_stable = bool(getattr(data, "heat_stable", False))
+
+        # BUGFIX: bme680 library v2.0.0 with BME688 chip (BME690 breakout)
+        # Pressure reads 4.33x too high - apply correction factor
+        pressure = pressure_raw * self._inv_pcorr
+
+        # Apply optional calibration; humidity is always clamped to 0..100
+        if self._hum_cal:
+            humidity = max(0.0, min(100.0, raw_humidity * HUM_SCALE + HUM_OFFSET))
+        else:
+            humidity = max(0.0, min(100.0, raw_humidity))
+        if self._temp_cal:
+            temperature = raw_temperature + TEMP_OFFSET
+        else:
+            temperature = raw_temperature
+
+        # Log calibration application if active (debug level)
+        if (self._hum_cal or self._temp_cal) and logger.isEnabledFor(logging.DEBUG):
+            if self._hum_cal and raw_humidity != humidity:
+                logger.debug("Humidity calibrated: %.1f%%RH → %.1f%%RH", raw_humidity, humidity)
+            if self._temp_cal:
+                logger.debug("Temperature calibrated: %.1f°C → %.1f°C", raw_temperature, temperature)
+
+        return humidity, temperature, pressure, gas_resistance
+
+    def read_all(self) -> Tuple[Optional[float], Optional[float], Optional[float], Optional[float], Dict[str, Any]]:
         """
-        Read sensor and return formatted values and status.
+        Read the sensor once and return both raw and formatted values.
 
-        Returns dict with keys:
-            temperature_str, humidity_str, pressure_str, gas_res_str, heat_stable
+        Returns:
+            Tuple (humidity, temperature, pressure, gas_resistance, formatted)
+            where formatted is the dict described in read_formatted(). Both
+            come from the same I2C acquisition. While the values are unchanged
+            (e.g. served from the read cache) the same formatted dict is
+            returned, so callers must not modify it.
         """
-        h, t, p, g = self.read()
+        values = self.read()
+        h, t, p, g = values
+        key = (values, self.heat_stable)
+        cached_key, fmt = self._last_fmt
+        if fmt is not None and cached_key == key:
+            return h, t, p, g, fmt
 
         fmt = {
             "temperature_str": "N/A",
@@ -277,7 +438,42 @@ class BME690Sensor:
         if g is not None and g > 0:
             fmt["gas_res_str"] = f"{g:.0f} Ω"
 
-        return fmt
+        self._last_fmt = (key, fmt)
+        return h, t, p, g, fmt
+
+    def read_formatted(self) -> Dict[str, Any]:
+        """
+        Read sensor and return formatted values and status.
+
+        Returns dict with keys:
+            temperature_str, humidity_str, pressure_str, gas_res_str, heat_stable
+        """
+        return self.read_all()[4]
+
+
+# Shared sensors by requested I2C address, created on first use
+_INSTANCES: Dict[Optional[int], BME690Sensor] = {}
+_INSTANCES_LOCK = threading.Lock()
+
+
+def get_sensor(i2c_addr: Optional[int] = None) -> BME690Sensor:
+    """
+    Return the process-wide BME690Sensor for an I2C address.
+
+    The first call probes and configures the sensor; later calls reuse it.
+    A sensor that failed to initialize is not kept, so the next call
+    tries the hardware again.
+
+    Args:
+        i2c_addr: I2C address as for BME690Sensor (None probes both).
+    """
+    with _INSTANCES_LOCK:
+        sensor = _INSTANCES.get(i2c_addr)
+        if sensor is None:
+            sensor = BME690Sensor(i2c_addr)
+            if sensor.available:
+                _INSTANCES[i2c_addr] = sensor
+        return sensor
 
 
 def test_sensor():
@@ -285,7 +481,7 @@ def test_sensor():
     import sys
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-    sensor = BME690Sensor()
+    sensor = get_sensor()
     if not sensor.available:
         print("ERROR: BME690 sensor not available")
         if not LIB_AVAILABLE:
@@ -14,11 +14,11 @@ from typing import Dict, Any, Optional
 
 # Import the BME690 sensor module
 try:
-    from sensors.bme690 import BME690Sensor
+    from sensors.bme690 import get_sensor
 except ImportError:
     # Handle case when run as script from parent directory
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from sensors.bme690 import BME690Sensor
+    from sensors.bme690 import get_sensor
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +28,7 @@ class BME690MCPTools:
 
     def __init__(self):
         """Initialize sensor and tools."""
-        self.sensor = BME690Sensor()
+        self.sensor = get_sensor()
 
     def get_sensor_status(self) -> Dict[str, Any]:
         """Get BME690 sensor status and availability."""
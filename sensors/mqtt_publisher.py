@@ -27,7 +27,7 @@ except ImportError:
 
 # Add parent directory to path for sensor imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from sensors.bme690 import BME690Sensor
+from sensors.bme690 import get_sensor
 
 # Config file paths (search in order)
 CONFIG_PATHS = [
@@ -121,7 +121,7 @@ class BME690Publisher:
         # Initialize sensor
         try:
             logger.info("Initializing BME690 sensor...")
-            self.sensor = BME690Sensor()
+            self.sensor = get_sensor()
             if not self.sensor.available:
                 logger.error("BME690 sensor not available - check I2C connection")
                 self.sensor = None